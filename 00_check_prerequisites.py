@@ -3,12 +3,18 @@
 Volatility3 MCP Server - Prerequisites Check (Cross-Platform)
 """
 
+import importlib.util
+import json
 import sys
 import subprocess
 import platform
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Probe results are reused until the interpreter, git or pip changes
+MANIFEST_FILE = Path.home() / "volatility-mcp-server" / ".prerequisites.json"
+
 def print_colored(text, color='white', style='normal'):
     """Print colored text for better readability"""
     colors = {
@@ -60,12 +66,114 @@ def check_python():
         print_colored(f"ERROR - Python check failed: {e}", 'red')
         return False
 
-def check_git():
+def get_tool_identity(path):
+    """Identify an executable by path, size and modification time"""
+    if not path:
+        return None
+    try:
+        stat_result = Path(path).stat()
+        return f"{Path(path).resolve()}:{stat_result.st_size}:{stat_result.st_mtime_ns}"
+    except OSError:
+        return None
+
+def get_pip_identity():
+    """Identify the pip module and the standalone pip commands that probe_pip() may run"""
+    try:
+        spec = importlib.util.find_spec('pip')
+        pip_module = spec.origin if spec else None
+    except (ImportError, ValueError):
+        pip_module = None
+    return [get_tool_identity(pip_module),
+            get_tool_identity(shutil.which('pip')),
+            get_tool_identity(shutil.which('pip3'))]
+
+def get_manifest_key():
+    """Build the key that decides whether cached probe results are still valid"""
+    return {
+        'python': get_tool_identity(sys.executable),
+        'git': get_tool_identity(shutil.which('git')),
+        'pip': get_pip_identity(),
+        'system': f"{platform.system()} {platform.release()}"
+    }
+
+def load_manifest():
+    """Load cached probe results if nothing relevant has changed"""
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if manifest.get('key') != get_manifest_key():
+        return None
+    return manifest.get('results')
+
+def save_manifest(results):
+    """Record successful probe results for later runs"""
+    try:
+        MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'key': get_manifest_key(), 'results': results}, f, indent=2)
+    except OSError:
+        pass
+
+def probe_git():
+    """Probe the Git installation"""
+    if shutil.which('git') is None:
+        return {'ok': False, 'missing': True}
+    
+    success, stdout, stderr = run_command('git --version')
+    if success and 'git version' in stdout:
+        return {'ok': True, 'version': stdout}
+    return {'ok': False, 'error': stderr}
+
+def probe_pip():
+    """Probe pip, falling back to the standalone commands concurrently"""
+    success, stdout, stderr = run_command(f'{sys.executable} -m pip --version')
+    if success and 'pip' in stdout.lower():
+        return {'ok': True, 'version': stdout}
+    
+    fallback_commands = ['pip --version', 'pip3 --version']
+    with ThreadPoolExecutor(max_workers=len(fallback_commands)) as executor:
+        for success, stdout, stderr in executor.map(run_command, fallback_commands):
+            if success and 'pip' in stdout.lower():
+                return {'ok': True, 'version': stdout}
+    return {'ok': False}
+
+def probe_venv():
+    """Probe virtual environment support"""
+    # Try to import venv module directly
+    try:
+        import venv
+        return {'ok': True}
+    except ImportError:
+        pass
+    
+    # Try command line venv
+    success, stdout, stderr = run_command(f'{sys.executable} -m venv --help')
+    return {'ok': success}
+
+def probe_all(use_cache=True):
+    """Run all probes concurrently, or reuse the manifest from a previous run"""
+    if use_cache:
+        cached = load_manifest()
+        if cached:
+            return cached, True
+    
+    probes = {'git': probe_git, 'pip': probe_pip, 'venv': probe_venv}
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = {name: executor.submit(probe) for name, probe in probes.items()}
+        results = {name: future.result() for name, future in futures.items()}
+    
+    if all(result['ok'] for result in results.values()):
+        save_manifest(results)
+    return results, False
+
+def check_git(result, cached=False):
     """Check Git installation"""
     print("Checking Git...", end=" ")
     
     # Check if git command is available
-    if shutil.which('git') is None:
+    if result.get('missing'):
         print_colored("ERROR - Git not found", 'red')
         system = platform.system().lower()
         if system == 'windows':
@@ -76,51 +184,31 @@ def check_git():
             print_colored("Please install Git using your package manager (e.g., apt install git, yum install git)", 'yellow')
         return False
     
-    success, stdout, stderr = run_command('git --version')
-    if success and 'git version' in stdout:
-        print_colored("OK - Git installed", 'green')
+    if result['ok']:
+        print_colored(f"OK - Git installed{' (cached)' if cached else ''}", 'green')
         return True
     else:
-        print_colored(f"ERROR - Git version check failed: {stderr}", 'red')
+        print_colored(f"ERROR - Git version check failed: {result.get('error', '')}", 'red')
         return False
 
-def check_pip():
+def check_pip(result, cached=False):
     """Check pip installation"""
     print("Checking pip...", end=" ")
     
-    # Try different ways to check pip
-    pip_commands = [
-        f'{sys.executable} -m pip --version',
-        'pip --version',
-        'pip3 --version'
-    ]
-    
-    for cmd in pip_commands:
-        success, stdout, stderr = run_command(cmd)
-        if success and 'pip' in stdout.lower():
-            print_colored("OK - pip installed", 'green')
-            return True
+    if result['ok']:
+        print_colored(f"OK - pip installed{' (cached)' if cached else ''}", 'green')
+        return True
     
     print_colored("ERROR - pip not found", 'red')
     print_colored("Please install pip or repair your Python installation", 'yellow')
     return False
 
-def check_venv():
+def check_venv(result, cached=False):
     """Check virtual environment support"""
     print("Checking venv module...", end=" ")
     
-    # Try to import venv module directly
-    try:
-        import venv
-        print_colored("OK - venv module available", 'green')
-        return True
-    except ImportError:
-        pass
-    
-    # Try command line venv
-    success, stdout, stderr = run_command(f'{sys.executable} -m venv --help')
-    if success:
-        print_colored("OK - venv module available", 'green')
+    if result['ok']:
+        print_colored(f"OK - venv module available{' (cached)' if cached else ''}", 'green')
         return True
     
     print_colored("ERROR - venv module not found", 'red')
@@ -146,16 +234,21 @@ def main():
     
     errors = 0
     
+    if not check_python():
+        errors += 1
+    
+    # Probe the external tools concurrently, or reuse cached results
+    results, cached = probe_all(use_cache='--no-cache' not in sys.argv)
+    
     # Run checks
     checks = [
-        check_python,
-        check_git,
-        check_pip,
-        check_venv
+        (check_git, 'git'),
+        (check_pip, 'pip'),
+        (check_venv, 'venv')
     ]
     
-    for check in checks:
-        if not check():
+    for check, name in checks:
+        if not check(results[name], cached):
             errors += 1
     
     print()
@@ -3,12 +3,27 @@
 Volatility3 MCP Server Setup (Cross-Platform)
 """
 
+import argparse
+import ast
+import hashlib
+import json
 import sys
 import subprocess
 import shutil
 import platform
+import tarfile
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import os
+import re
+
+VOLATILITY_REPO_URL = "https://github.com/volatilityfoundation/volatility3.git"
+
+# Parallel downloads used when a package index mirror is configured
+DOWNLOAD_WORKERS = 8
 
 def print_colored(text, color='white', style='normal'):
     """Print colored text for better readability"""
@@ -53,13 +68,6 @@ def get_python_executable():
     """Get the appropriate Python executable"""
     return sys.executable
 
-def get_pip_executable(venv_dir):
-    """Get the pip executable from virtual environment"""
-    if platform.system() == 'Windows':
-        return venv_dir / "Scripts" / "pip.exe"
-    else:
-        return venv_dir / "bin" / "pip"
-
 def get_venv_python(venv_dir):
     """Get the Python executable from virtual environment"""
     if platform.system() == 'Windows':
@@ -67,27 +75,159 @@ def get_venv_python(venv_dir):
     else:
         return venv_dir / "bin" / "python3"
 
+def file_sha256(path):
+    """Compute the SHA-256 of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def verify_bundle(bundle_path):
+    """Check an offline bundle against its expected SHA-256"""
+    expected = os.environ.get('VOLATILITY_MCP_VOL3_BUNDLE_SHA256', '').strip().lower()
+    checksum_file = bundle_path.with_name(bundle_path.name + '.sha256')
+    if not expected and checksum_file.exists():
+        expected = checksum_file.read_text(encoding='utf-8').split()[0].strip().lower()
+    
+    actual = file_sha256(bundle_path)
+    if not expected:
+        print_colored(f"ERROR: No SHA-256 given for {bundle_path.name} (computed {actual})", 'red')
+        print_colored("Set VOLATILITY_MCP_VOL3_BUNDLE_SHA256 or provide a .sha256 file next to the bundle", 'yellow')
+        return False
+    if actual != expected:
+        print_colored(f"ERROR: SHA-256 mismatch for {bundle_path.name}: expected {expected}, got {actual}", 'red')
+        return False
+    
+    print_colored(f"Verified {bundle_path.name} (sha256 {actual})", 'green')
+    return True
+
+def extract_tarball(tarball_path, volatility_dir):
+    """Extract a Volatility3 source tarball into the project"""
+    extract_dir = volatility_dir.parent / (volatility_dir.name + ".extract")
+    if extract_dir.exists():
+        shutil.rmtree(extract_dir)
+    extract_dir.mkdir(parents=True)
+    
+    with tarfile.open(tarball_path) as tar:
+        for member in tar.getmembers():
+            member_path = (extract_dir / member.name).resolve()
+            if extract_dir.resolve() not in member_path.parents and member_path != extract_dir.resolve():
+                print_colored(f"ERROR: Unsafe path in tarball: {member.name}", 'red')
+                shutil.rmtree(extract_dir)
+                return False
+            if member.issym() or member.islnk():
+                print_colored(f"ERROR: Links are not allowed in the tarball: {member.name}", 'red')
+                shutil.rmtree(extract_dir)
+                return False
+        tar.extractall(extract_dir)
+    
+    # Tarballs usually wrap the sources in a single top-level directory
+    entries = list(extract_dir.iterdir())
+    source_dir = entries[0] if len(entries) == 1 and entries[0].is_dir() else extract_dir
+    shutil.move(str(source_dir), str(volatility_dir))
+    if extract_dir.exists():
+        shutil.rmtree(extract_dir)
+    return True
+
+def ingest_volatility_bundle(bundle_path, volatility_dir, ref):
+    """Set up Volatility3 from a git bundle or source tarball for air-gapped hosts"""
+    print_colored(f"Ingesting Volatility3 from offline bundle {bundle_path}...", 'white')
+    
+    if not bundle_path.exists():
+        print_colored(f"ERROR: Bundle not found: {bundle_path}", 'red')
+        return False
+    if not verify_bundle(bundle_path):
+        return False
+    
+    if tarfile.is_tarfile(bundle_path):
+        if volatility_dir.exists():
+            print_colored("Volatility3 directory already exists, remove it to re-ingest a tarball", 'yellow')
+            return True
+        return extract_tarball(bundle_path, volatility_dir)
+    
+    if not volatility_dir.exists():
+        success, stdout, stderr = run_command(f'git clone "{bundle_path}" "{volatility_dir}"')
+        if not success:
+            print_colored(f"ERROR: Failed to clone from bundle: {stderr}", 'red')
+            return False
+        if not ref:
+            return True
+    
+    return checkout_volatility_ref(volatility_dir, ref or 'HEAD', f'"{bundle_path}"')
+
+def is_abbreviated_sha(ref):
+    """Check whether a ref looks like a shortened commit hash, which git fetch cannot resolve"""
+    return bool(re.fullmatch(r'[0-9a-fA-F]{7,39}', ref))
+
+def checkout_volatility_ref(volatility_dir, ref, remote='origin'):
+    """Fetch a single ref without history and check it out"""
+    success, stdout, stderr = run_command(f'git fetch --depth 1 {remote} {ref}', cwd=volatility_dir)
+    if not success:
+        print_colored(f"ERROR: Failed to fetch {ref}: {stderr}", 'red')
+        return False
+    
+    success, stdout, stderr = run_command('git checkout --quiet --detach FETCH_HEAD', cwd=volatility_dir)
+    if not success:
+        print_colored(f"ERROR: Failed to check out {ref}: {stderr}", 'red')
+        return False
+    return True
+
 def clone_or_update_volatility(volatility_dir):
     """Clone or update Volatility3 repository"""
     print_colored("Setting up Volatility3...", 'white')
     
-    if volatility_dir.exists():
-        print_colored("Volatility3 directory already exists, pulling latest changes...", 'yellow')
-        os.chdir(volatility_dir)
-        
-        # Try main branch first, then master
-        success, stdout, stderr = run_command('git pull origin main')
-        if not success:
-            success, stdout, stderr = run_command('git pull origin master')
-        
-        if success:
-            print_colored("Successfully updated Volatility3", 'green')
+    ref = os.environ.get('VOLATILITY_MCP_VOL3_REF', '').strip()
+    bundle = os.environ.get('VOLATILITY_MCP_VOL3_BUNDLE', '').strip()
+    
+    # Remotes only serve named refs and full object ids, so a short hash would fail mid-fetch
+    if is_abbreviated_sha(ref):
+        print_colored(f"ERROR: VOLATILITY_MCP_VOL3_REF={ref} looks like an abbreviated commit hash", 'red')
+        print_colored("Use the full 40-character commit SHA, a tag or a branch name", 'yellow')
+        return False
+    
+    if bundle:
+        if not ingest_volatility_bundle(Path(bundle), volatility_dir, ref):
+            return False
+    elif volatility_dir.exists():
+        if not (volatility_dir / ".git").exists():
+            print_colored("Volatility3 directory is not a git checkout, leaving it unchanged", 'yellow')
+        elif ref:
+            print_colored(f"Volatility3 directory already exists, checking out pinned ref {ref}...", 'yellow')
+            # Only a full SHA can be compared with HEAD; tags and branches are always refetched
+            # since a branch may have moved
+            success, stdout, stderr = run_command('git rev-parse HEAD', cwd=volatility_dir)
+            if not (success and stdout.strip().lower() == ref.lower()):
+                if not checkout_volatility_ref(volatility_dir, ref):
+                    return False
         else:
-            print_colored(f"Warning: Failed to update repository: {stderr}", 'yellow')
+            print_colored("Volatility3 directory already exists, pulling latest changes...", 'yellow')
+            
+            # Try main branch first, then master
+            success, stdout, stderr = run_command('git pull origin main', cwd=volatility_dir)
+            if not success:
+                success, stdout, stderr = run_command('git pull origin master', cwd=volatility_dir)
+            
+            if success:
+                print_colored("Successfully updated Volatility3", 'green')
+            else:
+                print_colored(f"Warning: Failed to update repository: {stderr}", 'yellow')
+    elif ref:
+        print_colored(f"Cloning Volatility3 at pinned ref {ref} (shallow)...", 'white')
+        volatility_dir.mkdir(parents=True)
+        success, stdout, stderr = run_command(
+            f'git init --quiet && git remote add origin {VOLATILITY_REPO_URL}',
+            cwd=volatility_dir
+        )
+        if not success or not checkout_volatility_ref(volatility_dir, ref):
+            print_colored(f"ERROR: Failed to clone repository: {stderr}", 'red')
+            shutil.rmtree(volatility_dir, ignore_errors=True)
+            return False
+        print_colored("Successfully cloned Volatility3", 'green')
     else:
-        print_colored("Cloning Volatility3 repository...", 'white')
+        print_colored("Cloning Volatility3 repository (shallow)...", 'white')
         success, stdout, stderr = run_command(
-            'git clone https://github.com/volatilityfoundation/volatility3.git',
+            f'git clone --depth 1 {VOLATILITY_REPO_URL} "{volatility_dir}"',
             cwd=volatility_dir.parent
         )
         
@@ -97,6 +237,10 @@ def clone_or_update_volatility(volatility_dir):
             print_colored(f"ERROR: Failed to clone repository: {stderr}", 'red')
             return False
     
+    success, stdout, stderr = run_command('git rev-parse HEAD', cwd=volatility_dir)
+    if success and stdout.strip():
+        print_colored(f"Volatility3 commit: {stdout.strip()}", 'cyan')
+    
     return True
 
 def create_virtual_environment(venv_dir):
@@ -113,40 +257,163 @@ def create_virtual_environment(venv_dir):
         print_colored(f"ERROR: Failed to create virtual environment: {stderr}", 'red')
         return False
 
+def get_pip_source_options(wheelhouse_dir, index_url=None, offline=False):
+    """Build pip options for the wheelhouse, index mirror and offline mode"""
+    options = f'--find-links "{wheelhouse_dir}"'
+    if offline:
+        options += ' --no-index'
+    elif index_url:
+        options += f' --index-url "{index_url}"'
+    return options
+
+def download_file(url, target_dir, expected_sha256=None):
+    """Download one distribution into the wheelhouse, verifying its hash"""
+    filename = urllib.parse.unquote(url.split('#')[0].rsplit('/', 1)[-1])
+    target = target_dir / filename
+    if target.exists():
+        return True, filename, "cached"
+    
+    temp_target = target.with_name(filename + '.part')
+    try:
+        digest = hashlib.sha256()
+        with urllib.request.urlopen(url, timeout=120) as response, open(temp_target, 'wb') as f:
+            for chunk in iter(lambda: response.read(1024 * 1024), b''):
+                digest.update(chunk)
+                f.write(chunk)
+        if expected_sha256 and digest.hexdigest() != expected_sha256:
+            temp_target.unlink()
+            return False, filename, "hash mismatch"
+        os.replace(temp_target, target)
+        return True, filename, "downloaded"
+    except Exception as e:
+        if temp_target.exists():
+            temp_target.unlink()
+        return False, filename, str(e)
+
+def prefetch_distributions(venv_python, requirement_args, wheelhouse_dir, index_url):
+    """Resolve once against the mirror and download all distributions in parallel"""
+    report_file = wheelhouse_dir / "resolve_report.json"
+    success, stdout, stderr = run_command(
+        f'"{venv_python}" -m pip install --dry-run --ignore-installed --quiet '
+        f'--report "{report_file}" {get_pip_source_options(wheelhouse_dir, index_url)} {requirement_args}'
+    )
+    if not success or not report_file.exists():
+        print_colored(f"Warning: Could not resolve dependencies against the mirror: {stderr}", 'yellow')
+        return False
+    
+    with open(report_file, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    
+    downloads = []
+    for item in report.get('install', []):
+        download_info = item.get('download_info', {})
+        url = download_info.get('url', '')
+        if not url or 'dir_info' in download_info or 'vcs_info' in download_info:
+            continue
+        hashes = download_info.get('archive_info', {}).get('hashes', {})
+        downloads.append((url, hashes.get('sha256')))
+    
+    print_colored(f"Downloading {len(downloads)} distributions from the mirror...", 'white')
+    all_ok = True
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        futures = [executor.submit(download_file, url, wheelhouse_dir, sha256) for url, sha256 in downloads]
+        for future in as_completed(futures):
+            ok, filename, status = future.result()
+            if not ok:
+                all_ok = False
+                print_colored(f"Warning: Failed to download {filename}: {status}", 'yellow')
+    return all_ok
+
+def get_package_sources(venv_dir):
+    """Read the wheelhouse, index mirror and offline settings from the environment"""
+    wheelhouse_dir = Path(os.environ.get('VOLATILITY_MCP_WHEELHOUSE', venv_dir.parent / "wheelhouse"))
+    index_url = os.environ.get('VOLATILITY_MCP_INDEX_URL')
+    offline = os.environ.get('VOLATILITY_MCP_OFFLINE', '').lower() in ('1', 'true', 'yes')
+    wheelhouse_dir.mkdir(parents=True, exist_ok=True)
+    return wheelhouse_dir, index_url, offline
+
+def get_requirement_args(volatility_dir, requirements_name="requirements.txt"):
+    """Volatility3 and MCP server requirements as pip arguments"""
+    mcp_packages = ['mcp', 'pydantic', 'typing-extensions']
+    requirement_args = ' '.join(mcp_packages)
+    requirements_file = volatility_dir / requirements_name
+    if requirements_file.exists():
+        requirement_args = f'-r "{requirements_file}" {requirement_args}'
+    return requirement_args
+
+def seed_wheelhouse(venv_dir, volatility_dir):
+    """Download every distribution an offline install needs into the wheelhouse"""
+    venv_python = get_venv_python(venv_dir)
+    wheelhouse_dir, index_url, offline = get_package_sources(venv_dir)
+    if offline:
+        print_colored("ERROR: Cannot seed the wheelhouse in offline mode", 'red')
+        return False
+    
+    # Run this with the same Python version and platform as the offline hosts
+    print_colored(f"Downloading dependencies into {wheelhouse_dir}...", 'white')
+    success, stdout, stderr = run_command(
+        f'"{venv_python}" -m pip download --dest "{wheelhouse_dir}" '
+        f'{get_pip_source_options(wheelhouse_dir, index_url)} pip {get_requirement_args(volatility_dir)}'
+    )
+    if not success:
+        print_colored(f"ERROR: Failed to download dependencies: {stderr}", 'red')
+        return False
+    
+    print_colored(f"Wheelhouse ready for VOLATILITY_MCP_OFFLINE=1 installs: {wheelhouse_dir}", 'green')
+    return True
+
 def install_requirements(venv_dir, volatility_dir):
     """Install required packages"""
     venv_python = get_venv_python(venv_dir)
-    venv_pip = get_pip_executable(venv_dir)
+    wheelhouse_dir, index_url, offline = get_package_sources(venv_dir)
+    
+    if offline:
+        print_colored(f"Offline mode: installing only from {wheelhouse_dir}", 'yellow')
+    elif index_url:
+        print_colored(f"Using package index mirror: {index_url}", 'white')
     
     # Upgrade pip first
     print_colored("Upgrading pip...", 'white')
-    success, stdout, stderr = run_command(f'"{venv_python}" -m pip install --upgrade pip')
+    success, stdout, stderr = run_command(
+        f'"{venv_python}" -m pip install --upgrade {get_pip_source_options(wheelhouse_dir, index_url, offline)} pip'
+    )
     if not success:
         print_colored(f"Warning: Failed to upgrade pip: {stderr}", 'yellow')
     
-    # Install Volatility3 dependencies
-    requirements_file = volatility_dir / "requirements.txt"
-    if requirements_file.exists():
-        print_colored("Installing Volatility3 dependencies...", 'white')
+    # Resolve Volatility3 and MCP server dependencies together in a single pip run
+    requirement_args = get_requirement_args(volatility_dir)
+    
+    if index_url and not offline:
+        if prefetch_distributions(venv_python, requirement_args, wheelhouse_dir, index_url):
+            offline = True
+    
+    def pip_install(requirement_args):
         success, stdout, stderr = run_command(
-            f'"{venv_pip}" install -r "{requirements_file}"'
+            f'"{venv_python}" -m pip install {get_pip_source_options(wheelhouse_dir, index_url, offline)} {requirement_args}'
         )
-        if not success:
-            print_colored(f"Warning: Some Volatility3 dependencies failed to install: {stderr}", 'yellow')
-        else:
-            print_colored("Volatility3 dependencies installed", 'green')
+        if not success and offline and index_url:
+            # Prefetched sdists may need build dependencies from the mirror
+            success, stdout, stderr = run_command(
+                f'"{venv_python}" -m pip install {get_pip_source_options(wheelhouse_dir, index_url)} {requirement_args}'
+            )
+        return success, stderr
     
-    # Install MCP server dependencies
-    print_colored("Installing MCP server dependencies...", 'white')
-    mcp_packages = ['mcp', 'pydantic', 'typing-extensions', 'asyncio']
+    print_colored("Installing Volatility3 and MCP server dependencies...", 'white')
+    success, stderr = pip_install(requirement_args)
     
-    for package in mcp_packages:
-        success, stdout, stderr = run_command(f'"{venv_pip}" install {package}')
+    # requirements.txt includes optional extras (yara, capstone, leechcorepyc, ...); one of them
+    # failing to build must not leave the venv without the MCP packages
+    if not success and (volatility_dir / "requirements-minimal.txt").exists():
+        print_colored(f"Warning: Full install failed, retrying with requirements-minimal.txt: {stderr}", 'yellow')
+        success, stderr = pip_install(get_requirement_args(volatility_dir, "requirements-minimal.txt"))
         if success:
-            print_colored(f"Installed {package}", 'green')
-        else:
-            print_colored(f"Warning: Failed to install {package}: {stderr}", 'yellow')
+            print_colored("Installed minimal Volatility3 dependencies; some optional plugins may not work", 'yellow')
     
+    if not success:
+        print_colored(f"ERROR: Failed to install dependencies: {stderr}", 'red')
+        return False
+    
+    print_colored("Dependencies installed", 'green')
     return True
 
 def create_project_structure(project_dir):
@@ -170,6 +437,168 @@ def create_project_structure(project_dir):
     
     return True
 
+def get_plugin_dirs(volatility_dir):
+    """Plugin source trees shipped with Volatility3; both share the plugin namespace"""
+    return [plugins_dir for plugins_dir in (volatility_dir / "volatility3" / "framework" / "plugins",
+                                            volatility_dir / "volatility3" / "plugins")
+            if plugins_dir.exists()]
+
+def get_volatility_revision(volatility_dir):
+    """Get an identifier for the current state of the Volatility3 checkout"""
+    success, stdout, stderr = run_command('git rev-parse HEAD', cwd=volatility_dir)
+    if success and stdout.strip():
+        return stdout.strip()
+    
+    # Not a git checkout - fingerprint the plugin sources instead
+    digest = hashlib.sha256()
+    for plugins_dir in get_plugin_dirs(volatility_dir):
+        for plugin_file in sorted(plugins_dir.rglob("*.py")):
+            stat_result = plugin_file.stat()
+            digest.update(f"{plugin_file.relative_to(volatility_dir)}:{stat_result.st_size}:{stat_result.st_mtime_ns}".encode())
+    return f"files-{digest.hexdigest()}"
+
+def get_dotted_name(node):
+    """Turn an AST Name/Attribute node into a dotted name"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        parent = get_dotted_name(node.value)
+        return f"{parent}.{node.attr}" if parent else node.attr
+    return ""
+
+def get_plugin_requirements(class_node):
+    """Collect requirement names declared in a plugin's get_requirements()"""
+    requirements = []
+    for item in class_node.body:
+        if not (isinstance(item, ast.FunctionDef) and item.name == "get_requirements"):
+            continue
+        for node in ast.walk(item):
+            if not isinstance(node, ast.Call):
+                continue
+            keywords = {kw.arg: kw.value for kw in node.keywords if kw.arg}
+            name = keywords.get("name")
+            if not (isinstance(name, ast.Constant) and isinstance(name.value, str)):
+                continue
+            optional = keywords.get("optional")
+            requirements.append({
+                "name": name.value,
+                "type": get_dotted_name(node.func).split(".")[-1],
+                "optional": bool(isinstance(optional, ast.Constant) and optional.value)
+            })
+    return requirements
+
+def parse_plugin_file(plugin_file, plugins_dir):
+    """Extract class metadata from a plugin module without importing it"""
+    try:
+        tree = ast.parse(plugin_file.read_text(encoding='utf-8'), filename=str(plugin_file))
+    except (SyntaxError, UnicodeDecodeError, OSError):
+        return []
+    
+    module_parts = list(plugin_file.relative_to(plugins_dir).with_suffix("").parts)
+    module_name = ".".join(module_parts)
+    os_family = module_parts[0] if module_parts[0] in ("windows", "linux", "mac") else "generic"
+    
+    classes = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = [get_dotted_name(base) for base in node.bases]
+        methods = {item.name for item in node.body if isinstance(item, ast.FunctionDef)}
+        docstring = (ast.get_docstring(node) or "").strip()
+        classes.append({
+            "name": f"{module_name}.{node.name}",
+            "module": module_name,
+            "class": node.name,
+            "os": os_family,
+            "bases": bases,
+            "is_plugin": (any(base.endswith("PluginInterface") for base in bases)
+                          or {"run", "get_requirements"} <= methods),
+            "description": docstring.splitlines()[0] if docstring else "",
+            "requirements": get_plugin_requirements(node)
+        })
+    return classes
+
+def resolve_base(base, module_name, classes_by_name):
+    """Find the parsed classes a base class expression may refer to"""
+    parts = base.split(".")
+    candidates = classes_by_name.get(parts[-1], [])
+    if len(parts) > 1:
+        # e.g. "svcscan.SvcScan" refers to a class in a module named svcscan
+        return [cls for cls in candidates if cls["module"].split(".")[-1] == parts[-2]]
+    local = [cls for cls in candidates if cls["module"] == module_name]
+    return local or candidates
+
+def resolve_plugins(classes):
+    """Mark classes that inherit from another plugin, however indirectly"""
+    classes_by_name = {}
+    for cls in classes:
+        classes_by_name.setdefault(cls["class"], []).append(cls)
+    
+    changed = True
+    while changed:
+        changed = False
+        for cls in classes:
+            if cls["is_plugin"]:
+                continue
+            for base in cls["bases"]:
+                parents = [parent for parent in resolve_base(base, cls["module"], classes_by_name)
+                           if parent["is_plugin"] and parent is not cls]
+                if not parents:
+                    continue
+                # Subclasses inherit their parent's requirements and description
+                cls["is_plugin"] = True
+                cls["requirements"] = cls["requirements"] or parents[0]["requirements"]
+                cls["description"] = cls["description"] or parents[0]["description"]
+                changed = True
+                break
+    
+    return [
+        {key: cls[key] for key in ("name", "module", "os", "description", "requirements")}
+        for cls in classes if cls["is_plugin"]
+    ]
+
+def build_plugin_index(volatility_dir, config_dir):
+    """Build the plugin index used by list_available_plugins and suggest_plugins"""
+    print_colored("Building plugin index...", 'white')
+    
+    plugin_dirs = get_plugin_dirs(volatility_dir)
+    index_file = config_dir / "plugin_index.json"
+    
+    if not plugin_dirs:
+        print_colored(f"Warning: No plugin directories found in {volatility_dir / 'volatility3'}", 'yellow')
+        return True
+    
+    revision = get_volatility_revision(volatility_dir)
+    if index_file.exists():
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                if json.load(f).get("revision") == revision:
+                    print_colored("Plugin index is up to date", 'green')
+                    return True
+        except (OSError, json.JSONDecodeError):
+            pass
+    
+    classes = []
+    for plugins_dir in plugin_dirs:
+        for plugin_file in sorted(plugins_dir.rglob("*.py")):
+            if plugin_file.name == "__init__.py":
+                continue
+            classes.extend(parse_plugin_file(plugin_file, plugins_dir))
+    plugins = resolve_plugins(classes)
+    
+    index = {
+        "revision": revision,
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "plugins": plugins
+    }
+    
+    config_dir.mkdir(parents=True, exist_ok=True)
+    with open(index_file, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+    
+    print_colored(f"Indexed {len(plugins)} plugins in {index_file}", 'green')
+    return True
+
 def main():
     """Main setup function"""
     print_colored("=== Setting up Volatility3 MCP Server (Cross-Platform) ===", 'cyan', 'bold')
@@ -185,27 +614,36 @@ def main():
     print_colored(f"System: {platform.system()} {platform.release()}", 'white')
     print()
     
+    # Individual steps can be run on their own (used by setup_all.py)
+    steps = {
+        "clone": lambda: clone_or_update_volatility(VOLATILITY_DIR),
+        "venv": lambda: create_virtual_environment(VENV_DIR),
+        "install": lambda: install_requirements(VENV_DIR, VOLATILITY_DIR),
+        "structure": lambda: create_project_structure(PROJECT_DIR),
+        "index": lambda: build_plugin_index(VOLATILITY_DIR, PROJECT_DIR / "config"),
+        # Not part of the default run: fills the wheelhouse for offline hosts
+        "wheelhouse": lambda: seed_wheelhouse(VENV_DIR, VOLATILITY_DIR)
+    }
+    default_steps = ["clone", "venv", "install", "structure", "index"]
+    
+    parser = argparse.ArgumentParser(description="Set up the Volatility3 MCP server project")
+    parser.add_argument("--step", choices=list(steps), help="Run a single setup step")
+    args = parser.parse_args()
+    
     try:
         # Create project directory
         print_colored(f"Creating project directory at {PROJECT_DIR}...", 'white')
         PROJECT_DIR.mkdir(parents=True, exist_ok=True)
         os.chdir(PROJECT_DIR)
         
-        # Clone/update Volatility3
-        if not clone_or_update_volatility(VOLATILITY_DIR):
-            return 1
-        
-        # Create virtual environment
-        if not create_virtual_environment(VENV_DIR):
-            return 1
-        
-        # Install requirements
-        if not install_requirements(VENV_DIR, VOLATILITY_DIR):
-            return 1
+        if args.step:
+            return 0 if steps[args.step]() else 1
         
-        # Create project structure
-        if not create_project_structure(PROJECT_DIR):
-            return 1
+        # Clone/update Volatility3, create the venv, install requirements,
+        # create the project structure and index the plugins
+        for step_name in default_steps:
+            if not steps[step_name]():
+                return 1
         
         print()
         print_colored("=== Project Structure Created Successfully! ===", 'green', 'bold')
@@ -43,6 +43,22 @@ The server should include these tools:
 - suggest_plugins
 - batch_execute
 - generate_documentation
+
+list_available_plugins and suggest_plugins can read config/plugin_index.json
+(written by 01_setup_volatility_mcp.py) instead of importing every plugin
+module. The index records each plugin's name, OS family, description and
+requirements, and is rebuilt when the volatility3/ checkout's commit changes.
+
+Linux/Mac kernel banners can be matched to ISF files through
+config/banner_index.bin (written by 06_prepare_symbols.py). Read it with
+src/banner_index.py, which 06 copies here:
+
+    from banner_index import lookup_banner
+    isf_paths = lookup_banner(config_dir / "banner_index.bin", banner)
+
+The file is a little-endian header (b'VMBI', version, record count, path
+table offset), then fixed-width records (16-byte truncated SHA-256 of the
+banner, path offset, path length) sorted by hash, then a UTF-8 path table.
 """
 
 readme_file = SRC_DIR / "README.md"
@@ -45,11 +45,26 @@ Cross-Platform Test Script for Volatility3 MCP Server
 
 import json
 import asyncio
+import os
 import sys
 import platform
+import queue
 import subprocess
+import threading
+import time
 from pathlib import Path
 
+# Benchmark settings
+SYNTHETIC_IMAGE_SIZE = 64 * 1024 * 1024
+SYNTHETIC_IMAGE_SEED = 1
+# windows.info exercises DTB/kernel discovery and ISF loading; banners scans the whole image
+BENCHMARK_PLUGINS = ["windows.info.Info", "banners.Banners"]
+# Timings are the fastest of BENCHMARK_REPEATS runs: slower runs are noise from I/O and
+# scheduling, which made medians of a few runs flag regressions on unchanged code
+BENCHMARK_REPEATS = 5
+REGRESSION_TOLERANCE = 0.25
+REGRESSION_SLACK = 0.05
+
 def print_colored(text, color='white', style='normal'):
     """Print colored text for better readability"""
     colors = {
@@ -162,11 +177,28 @@ def test_mcp_server():
                 "generate_documentation"
             ]
             
+            # Ask the running server for its tools over stdio
+            client = StdioMCPClient(project_dir)
+            client.start()
+            try:
+                client.initialize()
+                available_tools = client.list_tools()
+            except Exception as e:
+                print_colored(f"✗ MCP handshake over stdio failed: {e}", 'red')
+                return False
+            finally:
+                client.stop()
+            
             print_colored("\\nExpected MCP Tools:", 'white')
+            missing_tools = []
             for tool in expected_tools:
-                print_colored(f"  • {tool}", 'blue')
-                
-            return True
+                if tool in available_tools:
+                    print_colored(f"  ✓ {tool}", 'green')
+                else:
+                    print_colored(f"  ✗ {tool}", 'red')
+                    missing_tools.append(tool)
+            
+            return not missing_tools
             
         except ImportError as e:
             print_colored(f"✗ Failed to import MCP server: {e}", 'red')
@@ -228,6 +260,241 @@ def test_project_structure():
     
     return all_good
 
+class StdioMCPClient:
+    """Minimal MCP client that talks JSON-RPC to the server over stdio"""
+    
+    def __init__(self, project_dir):
+        self.project_dir = project_dir
+        self.process = None
+        self.responses = queue.Queue()
+        self.next_id = 1
+    
+    def start(self):
+        """Start the server through the launcher in its default mode, like an MCP client would"""
+        self.process = subprocess.Popen(
+            [sys.executable, str(self.project_dir / "launcher.py")],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.project_dir,
+            text=True,
+            bufsize=1
+        )
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+    
+    def _read_stdout(self):
+        """Collect JSON-RPC responses from the server's stdout"""
+        for line in self.process.stdout:
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(message, dict) and 'id' in message:
+                self.responses.put(message)
+        self.responses.put(None)
+    
+    def send(self, message):
+        """Write one JSON-RPC message to the server"""
+        self.process.stdin.write(json.dumps(message) + '\\n')
+        self.process.stdin.flush()
+    
+    def request(self, method, params=None, timeout=600):
+        """Send a request and wait for its response"""
+        request_id = self.next_id
+        self.next_id += 1
+        self.send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}})
+        
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"{method} timed out after {timeout}s")
+            try:
+                message = self.responses.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if message is None:
+                raise ConnectionError("Server closed the connection")
+            if message.get('id') == request_id:
+                if 'error' in message:
+                    raise RuntimeError(message['error'].get('message', str(message['error'])))
+                return message.get('result', {})
+    
+    def initialize(self):
+        """Perform the MCP initialize handshake"""
+        result = self.request("initialize", {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "volatility3-mcp-tests", "version": "1.0"}
+        }, timeout=120)
+        self.send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        return result
+    
+    def list_tools(self):
+        """Return the server's tool definitions keyed by name"""
+        return {tool['name']: tool for tool in self.request("tools/list").get('tools', [])}
+    
+    def call_tool(self, name, arguments, timeout=600):
+        """Call a tool and return its result"""
+        return self.request("tools/call", {"name": name, "arguments": arguments}, timeout=timeout)
+    
+    def stop(self):
+        """Shut the server down"""
+        if self.process and self.process.poll() is None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+
+def find_argument(tool, keywords):
+    """Find the input property of a tool whose name contains one of the keywords"""
+    properties = tool.get('inputSchema', {}).get('properties', {})
+    required = tool.get('inputSchema', {}).get('required', [])
+    for name in list(required) + list(properties):
+        if any(keyword in name.lower() for keyword in keywords):
+            return name
+    return required[0] if required else None
+
+def create_synthetic_image(project_dir):
+    """Create (or reuse) a small synthetic Windows image with scripts/generate_synthetic_image.py"""
+    image_path = project_dir / "tests" / "fixtures" / "synthetic_windows.raw"
+    manifest_file = image_path.with_name(image_path.name + ".json")
+    # The ISF goes where the server's Volatility3 looks for symbols by default;
+    # 06_prepare_symbols.py reads this manifest and leaves the fake kernel out of its index
+    symbols_dir = project_dir / "volatility3" / "volatility3" / "symbols"
+    
+    if image_path.exists() and manifest_file.exists():
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        pdb = manifest.get("pdb", {})
+        isf_file = symbols_dir / "windows" / pdb.get("name", "") / f"{pdb.get('guid')}-{pdb.get('age')}.json"
+        if (manifest.get("seed") == SYNTHETIC_IMAGE_SEED and manifest.get("size") == SYNTHETIC_IMAGE_SIZE
+                and isf_file.exists()):
+            return image_path
+    
+    sys.path.insert(0, str(project_dir / "scripts"))
+    from generate_synthetic_image import generate_image
+    generate_image(image_path, size=SYNTHETIC_IMAGE_SIZE, seed=SYNTHETIC_IMAGE_SEED, symbols=symbols_dir)
+    return image_path
+
+def time_call(func):
+    """Run a callable and return (seconds, succeeded)"""
+    start = time.perf_counter()
+    try:
+        result = func()
+        succeeded = not (isinstance(result, dict) and result.get('isError'))
+    except Exception:
+        succeeded = False
+    return time.perf_counter() - start, succeeded
+
+def run_benchmarks(update_baselines=False):
+    """Benchmark the server over stdio and compare against stored baselines"""
+    print_colored("="*70, 'cyan')
+    print_colored("VOLATILITY3 MCP SERVER - BENCHMARKS", 'cyan', 'bold')
+    print_colored("="*70, 'cyan')
+    launch_mode = os.environ.get('VOLATILITY_MCP_LAUNCH_MODE', 'auto')
+    print_colored(f"Launch mode: {launch_mode} (set VOLATILITY_MCP_LAUNCH_MODE to benchmark another mode)", 'white')
+    
+    project_dir = Path(__file__).parent.parent
+    tests_dir = Path(__file__).parent
+    baseline_file = tests_dir / "benchmark_baselines.json"
+    try:
+        image_path = create_synthetic_image(project_dir)
+    except (ImportError, OSError, ValueError) as e:
+        print_colored(f"✗ Could not create the synthetic image: {e}", 'red')
+        return False
+    
+    results = {}
+    
+    # Cold start: spawn the server and complete the handshake
+    timings = []
+    for _ in range(BENCHMARK_REPEATS):
+        client = StdioMCPClient(project_dir)
+        start = time.perf_counter()
+        client.start()
+        try:
+            client.initialize()
+            timings.append(time.perf_counter() - start)
+        except Exception as e:
+            print_colored(f"✗ Server failed to start: {e}", 'red')
+            return False
+        finally:
+            client.stop()
+    results["cold_start"] = {"seconds": min(timings), "ok": True}
+    
+    client = StdioMCPClient(project_dir)
+    client.start()
+    try:
+        client.initialize()
+        tools = client.list_tools()
+        
+        load_tool = tools.get("load_memory_image")
+        execute_tool = tools.get("execute_plugin")
+        if not load_tool or not execute_tool:
+            print_colored("✗ Server does not expose load_memory_image/execute_plugin", 'red')
+            return False
+        
+        image_argument = find_argument(load_tool, ("path", "image", "file"))
+        plugin_argument = find_argument(execute_tool, ("plugin",))
+        
+        seconds, ok = time_call(lambda: client.call_tool("load_memory_image", {image_argument: str(image_path)}))
+        results["load_memory_image"] = {"seconds": seconds, "ok": ok}
+        
+        for plugin in BENCHMARK_PLUGINS:
+            timings = []
+            all_ok = True
+            for _ in range(BENCHMARK_REPEATS):
+                seconds, ok = time_call(lambda: client.call_tool("execute_plugin", {plugin_argument: plugin}))
+                timings.append(seconds)
+                all_ok = all_ok and ok
+            results[f"execute_plugin:{plugin}"] = {"seconds": min(timings), "ok": all_ok}
+    except Exception as e:
+        print_colored(f"✗ Benchmark failed: {e}", 'red')
+        return False
+    finally:
+        client.stop()
+    
+    baselines = {}
+    if baseline_file.exists():
+        with open(baseline_file, 'r', encoding='utf-8') as f:
+            baselines = json.load(f)
+    
+    regressions = []
+    failures = []
+    print_colored(f"\\n{'Benchmark':<45}{'Seconds':>10}{'Baseline':>12}", 'white', 'bold')
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        baseline_text = f"{baseline:.3f}" if baseline is not None else "-"
+        color = 'green'
+        if not result["ok"]:
+            failures.append(name)
+            color = 'red'
+        elif baseline is not None and result["seconds"] > baseline * (1 + REGRESSION_TOLERANCE) + REGRESSION_SLACK:
+            regressions.append(name)
+            color = 'red'
+        print_colored(f"{name:<45}{result['seconds']:>10.3f}{baseline_text:>12}", color)
+    
+    # A failed call is usually fast, so its timing must never pass or become a baseline
+    if failures:
+        print_colored(f"\\n✗ Failed: {', '.join(failures)}", 'red', 'bold')
+        if update_baselines:
+            print_colored("Baselines not updated while benchmarks fail", 'yellow')
+        return False
+    
+    if update_baselines:
+        with open(baseline_file, 'w', encoding='utf-8') as f:
+            json.dump({name: round(result["seconds"], 4) for name, result in results.items()}, f, indent=2)
+        print_colored(f"\\nBaselines updated: {baseline_file}", 'green')
+        return True
+    
+    if regressions:
+        print_colored(f"\\n✗ Regressions: {', '.join(regressions)}", 'red', 'bold')
+        return False
+    
+    print_colored("\\n✓ No regressions against baselines", 'green', 'bold')
+    return True
+
 async def run_all_tests():
     """Run all tests"""
     print_colored("="*70, 'cyan')
@@ -267,6 +534,8 @@ async def run_all_tests():
     print_colored("="*70, 'cyan')
 
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        sys.exit(0 if run_benchmarks("--update-baselines" in sys.argv) else 1)
     asyncio.run(run_all_tests())
 '''
     
@@ -303,6 +572,573 @@ sys.exit(subprocess.call([sys.executable, str(test_script)]))
         os.chmod(runner_file, st.st_mode | stat.S_IEXEC)
     
     print_colored(f"Created test runner: {runner_file}", 'green')
+    
+    # Create the synthetic memory image generator
+    generator_content = '''#!/usr/bin/env python3
+"""
+Synthetic Memory Image Generator for Volatility3 MCP Server
+Writes sparse raw or LiME images with x64 page tables and pool-tagged objects,
+plus the ISF symbol file Volatility3 needs to load the synthetic kernel
+
+Only the page tables, kernel image and KUSER_SHARED_DATA use real Windows
+layouts, so windows.info and whole-image scans such as banners work. The
+process, handle, connection, file and mutant objects are custom pool bodies
+with ground truth in the manifest. No Volatility3 plugin can parse them, and
+pool/process plugins (windows.pslist, psscan, netscan, handles, ...) fail on
+these images, so the object counts do not change plugin cost; image size does.
+"""
+
+import argparse
+import json
+import random
+import struct
+import sys
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+PAGE_SIZE = 0x1000
+MIN_IMAGE_SIZE = 16 * 1024 * 1024
+MAX_IMAGE_SIZE = 256 * 1024 ** 3
+
+# x64 paging constants
+KERNEL_BASE = 0xFFFFF80000000000
+POOL_BASE = 0xFFFFF90000000000
+KUSER_SHARED_DATA = 0xFFFFF78000000000
+PTE_PRESENT_RW = 0x3
+PTE_NX = 1 << 63
+SELF_REF_INDEX = 0x1ED       # PML4 entry that maps the page tables onto themselves
+KERNEL_DTB = 0x1AA000        # inside the range Volatility3 scans first for x64 DTBs
+
+# Kernel image layout (RVAs) and the values windows.info reads from it
+KERNEL_PAGES = 16
+KERNEL_PDB_NAME = "ntkrnlmp.pdb"
+DEBUG_DIRECTORY_RVA = 0x1000
+KDBG_RVA = 0x4800
+VERSION_BLOCK_RVA = 0x5000
+NUMBER_PROCESSORS_RVA = 0x5100
+BUILD_LAB_RVA = 0x5200
+CSD_VERSION_RVA = 0x5300
+BUILD_LAB = b"19041.1.amd64fre.vb_release.191206-1406"
+
+# PE32+ headers: IMAGE_FILE_HEADER, IMAGE_OPTIONAL_HEADER64 (without data directories),
+# IMAGE_SECTION_HEADER and IMAGE_DEBUG_DIRECTORY
+PE_FILE_HEADER = struct.Struct('<HHIIIHH')
+PE_OPTIONAL_HEADER = struct.Struct('<HBBIIIIIQIIHHHHHHIIIIHHQQQQII')
+PE_SECTION_HEADER = struct.Struct('<8sIIIIIIHHI')
+PE_DEBUG_DIRECTORY = struct.Struct('<IIHHIIII')
+
+# LiME range header: magic, version, start, end (inclusive), reserved
+LIME_MAGIC = 0x4C694D45
+LIME_HEADER = struct.Struct('<IIQQ8s')
+
+# NTFS only allocates skipped ranges lazily for files flagged sparse
+FSCTL_SET_SPARSE = 0x900C4
+
+# x64 _POOL_HEADER: PreviousSize, PoolIndex, BlockSize, PoolType, PoolTag, ProcessBilled
+POOL_HEADER = struct.Struct('<BBBB4sQ')
+POOL_BLOCK_UNIT = 16
+
+# Object bodies written after the pool header (offsets are recorded in the manifest)
+PROCESS_BODY = struct.Struct('<QQQQ16s')         # pid, ppid, dtb, create time, image name
+CONNECTION_BODY = struct.Struct('<4s4sHHIQ')     # local ip, remote ip, local port, remote port, state, owner pid
+MUTANT_BODY = struct.Struct('<Q32s')             # owner pid, name
+FILE_BODY_HEADER = struct.Struct('<HH')          # name length, maximum length (UTF-16 bytes follow)
+HANDLE_ENTRY = struct.Struct('<QQ')              # object address, granted access
+HANDLES_PER_TABLE = (PAGE_SIZE - 64) // HANDLE_ENTRY.size
+
+PROCESS_NAMES = [
+    "System", "smss.exe", "csrss.exe", "wininit.exe", "services.exe", "lsass.exe",
+    "svchost.exe", "explorer.exe", "winlogon.exe", "spoolsv.exe", "dwm.exe",
+    "taskhostw.exe", "chrome.exe", "outlook.exe", "powershell.exe", "cmd.exe"
+]
+
+TCP_STATES = [1, 2, 5, 8]  # CLOSED, LISTENING, ESTABLISHED, TIME_WAIT
+
+def parse_size(text):
+    """Parse sizes such as 512M, 4G or 1T into bytes"""
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+    text = text.strip().upper().rstrip('B')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+class SparseImage:
+    """Physical memory model that only keeps pages that were written"""
+    
+    def __init__(self, size, rng):
+        self.size = size
+        self.rng = rng
+        self.pages = {}
+        self.page_count = size // PAGE_SIZE
+    
+    def allocate_page(self):
+        """Pick an unused physical page above the first megabyte"""
+        if len(self.pages) >= self.page_count - 0x100:
+            raise MemoryError("No free physical pages left in the image")
+        while True:
+            page = self.rng.randrange(0x100, self.page_count) * PAGE_SIZE
+            if page not in self.pages:
+                self.pages[page] = bytearray(PAGE_SIZE)
+                return page
+    
+    def write(self, physical, data):
+        """Write bytes at a physical address, within a single page"""
+        page = physical & ~(PAGE_SIZE - 1)
+        offset = physical - page
+        buffer = self.pages.setdefault(page, bytearray(PAGE_SIZE))
+        buffer[offset:offset + len(data)] = data
+    
+    def read_qword(self, physical):
+        """Read a little-endian 64-bit value"""
+        page = physical & ~(PAGE_SIZE - 1)
+        buffer = self.pages.get(page)
+        if buffer is None:
+            return 0
+        return struct.unpack_from('<Q', buffer, physical - page)[0]
+
+class AddressSpace:
+    """x64 4-level page tables rooted at a PML4 page"""
+    
+    def __init__(self, image, dtb=None):
+        self.image = image
+        self.dtb = dtb if dtb is not None else image.allocate_page()
+        # Windows maps every PML4 onto itself; Volatility3 finds DTBs by this entry
+        image.write(self.dtb + SELF_REF_INDEX * 8, struct.pack('<Q', self.dtb | PTE_PRESENT_RW | PTE_NX))
+    
+    def _next_table(self, table, index):
+        entry_address = table + index * 8
+        entry = self.image.read_qword(entry_address)
+        if entry & 1:
+            return entry & 0x000FFFFFFFFFF000
+        new_table = self.image.allocate_page()
+        self.image.write(entry_address, struct.pack('<Q', new_table | PTE_PRESENT_RW | 0x4))
+        return new_table
+    
+    def map_page(self, virtual, physical, executable=False):
+        """Map one 4 KiB virtual page to a physical page"""
+        pml4 = (virtual >> 39) & 0x1FF
+        pdpt = (virtual >> 30) & 0x1FF
+        pd = (virtual >> 21) & 0x1FF
+        pt = (virtual >> 12) & 0x1FF
+        
+        table = self._next_table(self.dtb, pml4)
+        table = self._next_table(table, pdpt)
+        table = self._next_table(table, pd)
+        flags = PTE_PRESENT_RW if executable else PTE_PRESENT_RW | PTE_NX
+        self.image.write(table + pt * 8, struct.pack('<Q', physical | flags))
+    
+    def share_kernel_half(self, kernel_space):
+        """Copy the kernel half of another PML4, like every process DTB does"""
+        for index in range(256, 512):
+            if index == SELF_REF_INDEX:
+                continue
+            entry = self.image.read_qword(kernel_space.dtb + index * 8)
+            if entry:
+                self.image.write(self.dtb + index * 8, struct.pack('<Q', entry))
+
+class PoolAllocator:
+    """Pack tagged objects into mapped kernel pool pages"""
+    
+    def __init__(self, image, kernel_space):
+        self.image = image
+        self.kernel_space = kernel_space
+        self.next_virtual = POOL_BASE
+        self.page_physical = None
+        self.page_offset = PAGE_SIZE
+    
+    def allocate(self, tag, body):
+        """Write a pool header and object body, returning (virtual, physical)"""
+        block_size = -(-(POOL_HEADER.size + len(body)) // POOL_BLOCK_UNIT)
+        length = block_size * POOL_BLOCK_UNIT
+        if self.page_offset + length > PAGE_SIZE:
+            self.page_physical = self.image.allocate_page()
+            self.kernel_space.map_page(self.next_virtual, self.page_physical)
+            self.next_virtual += PAGE_SIZE
+            self.page_offset = 0
+        
+        physical = self.page_physical + self.page_offset
+        virtual = self.next_virtual - PAGE_SIZE + self.page_offset
+        header = POOL_HEADER.pack(0, 0, block_size, 2, tag, 0)
+        self.image.write(physical, header + body)
+        self.page_offset += length
+        return virtual, physical
+
+def build_pe_header(guid, age, timestamp):
+    """DOS/PE32+ headers whose debug directory holds the kernel's CodeView record"""
+    header = bytearray(PAGE_SIZE)
+    header[0:2] = b'MZ'
+    struct.pack_into('<I', header, 0x3C, 0x100)
+    header[0x100:0x104] = b'PE' + bytes(2)
+    
+    optional_offset = 0x104 + PE_FILE_HEADER.size
+    directories_offset = optional_offset + PE_OPTIONAL_HEADER.size
+    section_offset = directories_offset + 16 * 8
+    PE_FILE_HEADER.pack_into(header, 0x104, 0x8664, 1, timestamp, 0, 0, section_offset - optional_offset, 0x22)
+    image_size = KERNEL_PAGES * PAGE_SIZE
+    PE_OPTIONAL_HEADER.pack_into(
+        header, optional_offset,
+        0x20B, 14, 0, image_size - PAGE_SIZE, 0, 0, PAGE_SIZE, PAGE_SIZE, KERNEL_BASE,
+        PAGE_SIZE, PAGE_SIZE, 10, 0, 10, 0, 10, 0, 0, image_size, PAGE_SIZE, 0, 1, 0,
+        0x80000, 0x1000, 0x100000, 0x1000, 0, 16
+    )
+    
+    codeview = b'RSDS' + guid.bytes_le + struct.pack('<I', age) + KERNEL_PDB_NAME.encode() + b'\\0'
+    codeview_rva = DEBUG_DIRECTORY_RVA + PE_DEBUG_DIRECTORY.size
+    struct.pack_into('<II', header, directories_offset + 6 * 8, DEBUG_DIRECTORY_RVA, PE_DEBUG_DIRECTORY.size)
+    PE_SECTION_HEADER.pack_into(header, section_offset, b'.text', image_size - PAGE_SIZE, PAGE_SIZE,
+                                image_size - PAGE_SIZE, PAGE_SIZE, 0, 0, 0, 0, 0x60000020)
+    
+    debug_directory = PE_DEBUG_DIRECTORY.pack(0, timestamp, 0, 0, 2, len(codeview), codeview_rva, codeview_rva)
+    return bytes(header), debug_directory + codeview
+
+def build_kernel(image, kernel_space, guid, age, timestamp):
+    """Map a small kernel image with the PE, KDBG and version data windows.info reads"""
+    kernel_pages = []
+    for index in range(KERNEL_PAGES):
+        physical = image.allocate_page()
+        kernel_space.map_page(KERNEL_BASE + index * PAGE_SIZE, physical, executable=True)
+        kernel_pages.append(physical)
+    
+    def write_rva(rva, data):
+        image.write(kernel_pages[rva // PAGE_SIZE] + rva % PAGE_SIZE, data)
+    
+    header, debug_data = build_pe_header(guid, age, timestamp)
+    write_rva(0, header)
+    write_rva(DEBUG_DIRECTORY_RVA, debug_data)
+    
+    # KDBG block: list entry, owner tag, size, KernBase, then the NtBuildLab/CmNtCSDVersion pointers
+    kdbg = bytearray(0x368)
+    struct.pack_into('<QQ4sIQ', kdbg, 0, 0, 0, b'KDBG', len(kdbg), KERNEL_BASE)
+    struct.pack_into('<Q', kdbg, 520, KERNEL_BASE + BUILD_LAB_RVA)
+    struct.pack_into('<Q', kdbg, 616, KERNEL_BASE + CSD_VERSION_RVA)
+    write_rva(KDBG_RVA, bytes(kdbg))
+    
+    # _DBGKD_GET_VERSION64: MajorVersion, MinorVersion (build), ..., MachineType, ..., KernBase
+    write_rva(VERSION_BLOCK_RVA, struct.pack('<HHHHH6xQ', 0xF, 19041, 6, 0, 0x8664, KERNEL_BASE))
+    write_rva(NUMBER_PROCESSORS_RVA, struct.pack('<I', 4))
+    write_rva(BUILD_LAB_RVA, BUILD_LAB + b'\\0')
+    write_rva(CSD_VERSION_RVA, struct.pack('<I', 0))
+    return KERNEL_BASE + KDBG_RVA
+
+def build_kuser_shared_data(image, kernel_space, system_time):
+    """Map _KUSER_SHARED_DATA, which Volatility3 checks before accepting a DTB"""
+    physical = image.allocate_page()
+    kernel_space.map_page(KUSER_SHARED_DATA, physical)
+    image.write(physical + 0x14, struct.pack('<IiI', system_time & 0xFFFFFFFF, system_time >> 32, system_time >> 32))
+    image.write(physical + 0x30, "C:\\\\Windows".encode('utf-16-le') + bytes(2))
+    image.write(physical + 0x264, struct.pack('<IIII', 1, 1, 10, 0))  # WinNt, valid, 10.0
+
+def build_symbol_table(guid, age):
+    """ISF describing the synthetic kernel, in the layout pdbconv.py produces"""
+    def base(name):
+        return {"kind": "base", "name": name}
+    
+    def fields(**members):
+        return {name: {"type": member_type, "offset": offset} for name, (member_type, offset) in members.items()}
+    
+    def integer(size, signed):
+        return {"kind": "int", "size": size, "signed": signed, "endian": "little"}
+    
+    base_types = {
+        "char": {"kind": "char", "size": 1, "signed": True, "endian": "little"},
+        "unsigned char": integer(1, False),
+        "short": integer(2, True),
+        "unsigned short": integer(2, False),
+        "int": integer(4, True),
+        "unsigned int": integer(4, False),
+        "long": integer(4, True),
+        "unsigned long": integer(4, False),
+        "long long": integer(8, True),
+        "unsigned long long": integer(8, False),
+        "pointer": integer(8, False),
+        "void": {"kind": "void", "size": 0, "signed": False, "endian": "little"}
+    }
+    
+    pointer = {"kind": "pointer", "subtype": base("void")}
+    user_types = {
+        "_LIST_ENTRY": {"kind": "struct", "size": 16, "fields": fields(
+            Flink=(pointer, 0), Blink=(pointer, 8))},
+        "_UNICODE_STRING": {"kind": "struct", "size": 16, "fields": fields(
+            Length=(base("unsigned short"), 0), MaximumLength=(base("unsigned short"), 2), Buffer=(pointer, 8))},
+        "_KSYSTEM_TIME": {"kind": "struct", "size": 12, "fields": fields(
+            LowPart=(base("unsigned long"), 0), High1Time=(base("long"), 4), High2Time=(base("long"), 8))},
+        "_KUSER_SHARED_DATA": {"kind": "struct", "size": 0x720, "fields": fields(
+            SystemTime=({"kind": "struct", "name": "_KSYSTEM_TIME"}, 0x14),
+            NtSystemRoot=({"kind": "array", "count": 260, "subtype": base("unsigned short")}, 0x30),
+            NtProductType=({"kind": "enum", "name": "_NT_PRODUCT_TYPE"}, 0x264),
+            ProductTypeIsValid=(base("unsigned char"), 0x268),
+            NtMajorVersion=(base("unsigned long"), 0x26C),
+            NtMinorVersion=(base("unsigned long"), 0x270))},
+        "_DBGKD_GET_VERSION64": {"kind": "struct", "size": 40, "fields": fields(
+            MajorVersion=(base("unsigned short"), 0), MinorVersion=(base("unsigned short"), 2),
+            ProtocolVersion=(base("unsigned short"), 4), Flags=(base("unsigned short"), 6),
+            MachineType=(base("unsigned short"), 8), KernBase=(base("unsigned long long"), 16),
+            PsLoadedModuleList=(base("unsigned long long"), 24),
+            DebuggerDataList=(base("unsigned long long"), 32))}
+    }
+    # Types Volatility3 attaches extension classes to. They are empty, so plugins that walk
+    # processes or scan pools stop with an invalid symbol table error on these images
+    for name in ("_ETHREAD", "_KTHREAD", "_EPROCESS", "_ERESOURCE", "_EX_FAST_REF", "_TOKEN",
+                 "_OBJECT_HEADER", "_FILE_OBJECT", "_DEVICE_OBJECT", "_CM_KEY_BODY", "_CMHIVE",
+                 "_CM_KEY_NODE", "_CM_KEY_VALUE", "_HMAP_ENTRY", "_MMVAD_SHORT", "_MMVAD", "_KMUTANT",
+                 "_DRIVER_OBJECT", "_OBJECT_SYMBOLIC_LINK", "_CONTROL_AREA", "_SHARED_CACHE_MAP", "_VACB",
+                 "_POOL_TRACKER_BIG_PAGES", "_IMAGE_DOS_HEADER", "_KTIMER", "_LDR_DATA_TABLE_ENTRY"):
+        user_types[name] = {"kind": "struct", "size": 0, "fields": {}}
+    
+    return {
+        "metadata": {
+            "format": "6.1.0",
+            "producer": {"name": "generate_synthetic_image.py", "version": "1.0.0"},
+            "windows": {"pdb": {"GUID": guid.hex.upper(), "age": age,
+                                "database": KERNEL_PDB_NAME, "machine_type": 0x8664}}
+        },
+        "base_types": base_types,
+        "user_types": user_types,
+        "enums": {
+            "_NT_PRODUCT_TYPE": {"size": 4, "base": "long", "constants": {
+                "NtProductWinNt": 1, "NtProductLanManNt": 2, "NtProductServer": 3}}
+        },
+        "symbols": {
+            "KdDebuggerDataBlock": {"address": KDBG_RVA},
+            "KdVersionBlock": {"address": VERSION_BLOCK_RVA},
+            "KeNumberProcessors": {"address": NUMBER_PROCESSORS_RVA}
+        }
+    }
+
+def file_object_name(index):
+    """UTF-16 path stored in a synthetic file object"""
+    return f"\\\\Device\\\\HarddiskVolume3\\\\Users\\\\analyst\\\\file{index:05d}.dat".encode('utf-16-le')
+
+def split_handles(handles, process_count):
+    """Spread handles as evenly as possible across processes"""
+    per_process = [handles // process_count] * process_count
+    for index in range(handles % process_count):
+        per_process[index] += 1
+    return per_process
+
+def pool_body_sizes(counts):
+    """Body sizes of the pool blocks generate_objects() allocates, in order"""
+    sizes = [PROCESS_BODY.size] * counts.processes
+    sizes += [FILE_BODY_HEADER.size + len(file_object_name(index)) for index in range(counts.files)]
+    sizes += [MUTANT_BODY.size] * counts.mutants + [CONNECTION_BODY.size] * counts.connections
+    if counts.processes and counts.files + counts.mutants and counts.handles:
+        for count in split_handles(counts.handles, counts.processes):
+            full_tables, remainder = divmod(count, HANDLES_PER_TABLE)
+            sizes += [HANDLES_PER_TABLE * HANDLE_ENTRY.size] * full_tables
+            if remainder:
+                sizes.append(remainder * HANDLE_ENTRY.size)
+    return sizes
+
+def estimate_pages(counts):
+    """Upper bound on the physical pages generating these objects will use"""
+    pool_pages = 0
+    page_offset = PAGE_SIZE
+    for body_size in pool_body_sizes(counts):
+        length = -(-(POOL_HEADER.size + body_size) // POOL_BLOCK_UNIT) * POOL_BLOCK_UNIT
+        if page_offset + length > PAGE_SIZE:
+            pool_pages += 1
+            page_offset = 0
+        page_offset += length
+    
+    # Kernel PML4 and the page tables for the kernel image, KUSER_SHARED_DATA and the pool
+    page_tables = 1 + 3 + 3 + 1 + -(-pool_pages // 512 ** 2) + -(-pool_pages // 512)
+    return page_tables + KERNEL_PAGES + 1 + pool_pages + counts.processes
+
+def generate_objects(image, kernel_space, pool, counts, rng):
+    """Create processes, file, mutant, connection and handle objects"""
+    manifest = {"processes": [], "files": [], "mutants": [], "connections": [], "handles": 0}
+    base_time = 133000000000000000 + rng.randrange(10 ** 12)
+    
+    processes = []
+    spaces = []
+    for index in range(counts.processes):
+        pid = 4 if index == 0 else 100 + index * 4
+        ppid = 0 if index == 0 else processes[rng.randrange(len(processes))]["pid"]
+        name = PROCESS_NAMES[index] if index < len(PROCESS_NAMES) else rng.choice(PROCESS_NAMES[6:])
+        space = AddressSpace(image)
+        
+        body = PROCESS_BODY.pack(pid, ppid, space.dtb, base_time + index * 10 ** 7, name.encode()[:15])
+        virtual, physical = pool.allocate(b'Proc', body)
+        processes.append({"pid": pid, "ppid": ppid, "name": name, "dtb": space.dtb,
+                          "virtual": virtual, "physical": physical})
+        spaces.append(space)
+    manifest["processes"] = processes
+    
+    objects = []
+    for index in range(counts.files):
+        name = file_object_name(index)
+        virtual, physical = pool.allocate(b'File', FILE_BODY_HEADER.pack(len(name), len(name)) + name)
+        manifest["files"].append({"virtual": virtual, "physical": physical})
+        objects.append(virtual)
+    
+    for index in range(counts.mutants):
+        owner = rng.choice(processes)["pid"] if processes else 0
+        name = f"Global\\\\Mutex{index:05d}".encode()[:32]
+        virtual, physical = pool.allocate(b'Muta', MUTANT_BODY.pack(owner, name))
+        manifest["mutants"].append({"virtual": virtual, "physical": physical, "owner": owner})
+        objects.append(virtual)
+    
+    for index in range(counts.connections):
+        owner = rng.choice(processes)["pid"] if processes else 0
+        local_ip = bytes([10, 0, rng.randrange(256), rng.randrange(1, 255)])
+        remote_ip = bytes([rng.randrange(1, 224), rng.randrange(256), rng.randrange(256), rng.randrange(1, 255)])
+        body = CONNECTION_BODY.pack(local_ip, remote_ip, rng.randrange(1024, 65535),
+                                    rng.choice([80, 443, 445, 3389, 8080]), rng.choice(TCP_STATES), owner)
+        virtual, physical = pool.allocate(b'TcpE', body)
+        manifest["connections"].append({"virtual": virtual, "physical": physical, "owner": owner})
+    
+    # Spread handles across processes, each table pointing at file/mutant objects
+    if processes and objects and counts.handles:
+        for process, count in zip(processes, split_handles(counts.handles, len(processes))):
+            remaining = count
+            while remaining:
+                batch = min(remaining, HANDLES_PER_TABLE)
+                body = b''.join(HANDLE_ENTRY.pack(rng.choice(objects), 0x1F0003) for _ in range(batch))
+                pool.allocate(b'Obtb', body)
+                remaining -= batch
+            process["handles"] = count
+        manifest["handles"] = counts.handles
+    
+    # Share the kernel half only now, once all pool pages are mapped
+    for space in spaces:
+        space.share_kernel_half(kernel_space)
+    return manifest
+
+def mark_sparse(f):
+    """Flag an open file as sparse on Windows; POSIX filesystems need no flag"""
+    if sys.platform != 'win32':
+        return True
+    import ctypes
+    import msvcrt
+    from ctypes import wintypes
+    
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.DeviceIoControl.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD,
+                                         wintypes.LPVOID, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+                                         wintypes.LPVOID]
+    kernel32.DeviceIoControl.restype = wintypes.BOOL
+    returned = wintypes.DWORD()
+    return bool(kernel32.DeviceIoControl(msvcrt.get_osfhandle(f.fileno()), FSCTL_SET_SPARSE,
+                                         None, 0, None, 0, ctypes.byref(returned), None))
+
+def write_image(image, output, image_format):
+    """Write pages sparsely, seeking over everything that was never touched"""
+    data_offset = 0
+    with open(output, 'wb') as f:
+        if not mark_sparse(f):
+            print("Warning: Could not mark the image sparse, it will use its full size on disk", file=sys.stderr)
+        if image_format == 'lime':
+            f.write(LIME_HEADER.pack(LIME_MAGIC, 1, 0, image.size - 1, bytes(8)))
+            data_offset = LIME_HEADER.size
+        for physical in sorted(image.pages):
+            f.seek(data_offset + physical)
+            f.write(image.pages[physical])
+        f.truncate(data_offset + image.size)
+
+def generate_image(output, image_format="raw", size="1G", processes=40, handles=4000, connections=100,
+                   files=500, mutants=100, seed=0, symbols=None):
+    """Write a synthetic image, its ISF symbols and manifest; returns the manifest
+    
+    size is in bytes or a string such as "64M". Raises ValueError when the size
+    is out of range or too small for the requested objects.
+    """
+    counts = SimpleNamespace(processes=processes, handles=handles, connections=connections,
+                             files=files, mutants=mutants)
+    size_bytes = (parse_size(size) if isinstance(size, str) else size) // PAGE_SIZE * PAGE_SIZE
+    if not MIN_IMAGE_SIZE <= size_bytes <= MAX_IMAGE_SIZE:
+        raise ValueError(f"Image size must be between 16M and 256G, got {size}")
+    
+    # Fail up front rather than running out of physical pages halfway through
+    needed_pages = estimate_pages(counts)
+    available_pages = size_bytes // PAGE_SIZE - 0x100
+    if needed_pages > available_pages:
+        raise ValueError(f"These objects need about {needed_pages} pages but a {size} image only has "
+                         f"{available_pages} usable pages; increase the size or reduce the object counts")
+    
+    rng = random.Random(seed)
+    image = SparseImage(size_bytes, rng)
+    kernel_space = AddressSpace(image, dtb=KERNEL_DTB)
+    pool = PoolAllocator(image, kernel_space)
+    
+    guid = uuid.UUID(int=rng.getrandbits(128))
+    age = 1
+    kdbg = build_kernel(image, kernel_space, guid, age, rng.randrange(0x50000000, 0x60000000))
+    build_kuser_shared_data(image, kernel_space, 133000000000000000 + rng.randrange(10 ** 12))
+    manifest = generate_objects(image, kernel_space, pool, counts, rng)
+    manifest.update({
+        "format": image_format,
+        "size": size_bytes,
+        "seed": seed,
+        "page_size": PAGE_SIZE,
+        "dtb": kernel_space.dtb,
+        "kernel_base": KERNEL_BASE,
+        "kdbg": kdbg,
+        "pdb": {"name": KERNEL_PDB_NAME, "guid": guid.hex.upper(), "age": age},
+        "pages_written": len(image.pages)
+    })
+    
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    write_image(image, output, image_format)
+    
+    # Volatility3 looks kernel symbols up as windows/<pdb name>/<GUID>-<age>.json
+    symbols_dir = Path(symbols) if symbols else output.with_name(output.name + ".symbols")
+    isf_file = symbols_dir / "windows" / KERNEL_PDB_NAME / f"{guid.hex.upper()}-{age}.json"
+    isf_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(isf_file, 'w', encoding='utf-8') as f:
+        json.dump(build_symbol_table(guid, age), f, indent=2)
+    manifest["symbols"] = str(symbols_dir)
+    
+    with open(output.with_name(output.name + ".json"), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def main():
+    """Generate a synthetic memory image and its ground-truth manifest"""
+    parser = argparse.ArgumentParser(
+        description="Generate a sparse synthetic memory image",
+        epilog="Object counts only shape the custom pool objects recorded in the manifest; "
+               "Volatility3 process and pool plugins cannot read them")
+    parser.add_argument("output", help="Path of the image to write")
+    parser.add_argument("--format", choices=["raw", "lime"], default="raw")
+    parser.add_argument("--size", default="1G", help="Image size, e.g. 512M, 4G, 256G")
+    parser.add_argument("--processes", type=int, default=40)
+    parser.add_argument("--handles", type=int, default=4000)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--mutants", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--symbols", help="Directory for the kernel ISF file (default: <output>.symbols)")
+    args = parser.parse_args()
+    
+    try:
+        manifest = generate_image(args.output, args.format, args.size, args.processes, args.handles,
+                                  args.connections, args.files, args.mutants, args.seed, args.symbols)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    
+    print(f"Wrote {args.format} image: {args.output} ({manifest['size']} bytes, "
+          f"{manifest['pages_written']} pages populated)")
+    print(f"Load it with: vol -s {manifest['symbols']} -f {args.output} windows.info")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+    
+    SCRIPTS_DIR = PROJECT_DIR / "scripts"
+    SCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
+    generator_file = SCRIPTS_DIR / "generate_synthetic_image.py"
+    with open(generator_file, 'w', encoding='utf-8') as f:
+        f.write(generator_content)
+    
+    if platform.system() != 'Windows':
+        st = os.stat(generator_file)
+        os.chmod(generator_file, st.st_mode | stat.S_IEXEC)
+    
+    print_colored(f"Created synthetic image generator: {generator_file}", 'green')
 
 if __name__ == "__main__":
     print_colored("=== Creating Test Scripts ===", 'cyan', 'bold')
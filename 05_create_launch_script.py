@@ -50,9 +50,16 @@ Compatible with Windows, Linux, and macOS
 import sys
 import os
 import platform
+import runpy
 import subprocess
 from pathlib import Path
 
+# How the server is started: "auto", "inprocess", "exec" or "subprocess".
+# "auto" runs the server in this interpreter when it already is the venv
+# Python, replaces the launcher with exec() on Linux/macOS, and falls back
+# to a child process on Windows where exec() does not keep the stdio pipe.
+LAUNCH_MODE_ENV = "VOLATILITY_MCP_LAUNCH_MODE"
+
 def setup_environment():
     """Set up environment variables"""
     project_dir = Path(__file__).parent
@@ -85,6 +92,48 @@ def find_python_executable():
     
     return python_exe
 
+def running_in_venv(venv_dir):
+    """Check whether this interpreter already belongs to the virtual environment"""
+    try:
+        return Path(sys.prefix).resolve() == venv_dir.resolve()
+    except OSError:
+        return False
+
+def resolve_launch_mode(venv_dir):
+    """Pick the launch mode from the environment or the current platform"""
+    mode = os.environ.get(LAUNCH_MODE_ENV, 'auto').strip().lower()
+    if mode in ('inprocess', 'exec', 'subprocess'):
+        return mode
+    
+    if running_in_venv(venv_dir):
+        return 'inprocess'
+    if platform.system() != 'Windows':
+        return 'exec'
+    return 'subprocess'
+
+def run_inprocess(server_script, project_dir, volatility_dir):
+    """Run the server in this interpreter, sharing the launcher's stdio"""
+    # PYTHONPATH only applies to new interpreters, so extend sys.path directly
+    for path in (str(server_script.parent), str(volatility_dir)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    
+    os.chdir(project_dir)
+    sys.argv = [str(server_script)]
+    runpy.run_path(str(server_script), run_name="__main__")
+    return 0
+
+def run_exec(python_exe, server_script, project_dir):
+    """Replace the launcher process with the venv interpreter running the server"""
+    os.chdir(project_dir)
+    os.execv(str(python_exe), [str(python_exe), str(server_script)])
+
+def run_subprocess(python_exe, server_script, project_dir):
+    """Run the server as a child process and wait for it"""
+    result = subprocess.run([str(python_exe), str(server_script)], 
+                          cwd=project_dir)
+    return result.returncode
+
 def main():
     """Main launcher function - silent mode for MCP server"""
     # Get project directories
@@ -116,13 +165,19 @@ def main():
     # Set up environment
     setup_environment()
     
+    launch_mode = resolve_launch_mode(project_dir / "venv")
+    
     try:
         # Execute the server directly without any output
-        result = subprocess.run([str(python_exe), str(server_script)], 
-                              cwd=project_dir)
-        return result.returncode
+        if launch_mode == 'inprocess':
+            return run_inprocess(server_script, project_dir, volatility_dir)
+        if launch_mode == 'exec':
+            run_exec(python_exe, server_script, project_dir)
+        return run_subprocess(python_exe, server_script, project_dir)
     except KeyboardInterrupt:
         return 0
+    except SystemExit as e:
+        return e.code
     except Exception as e:
         print(f"ERROR: Failed to start server: {e}", file=sys.stderr)
         return 1
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Volatility3 MCP Server - Symbol Cache Preparation (Cross-Platform)
+"""
+
+import argparse
+import base64
+import binascii
+import bz2
+import gzip
+import json
+import lzma
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from banner_index import (BANNER_HEADER, BANNER_MAGIC, BANNER_RECORD, BANNER_VERSION,
+                          banner_key, lookup_banner, normalize_banner)
+
+# ISF file extensions understood by Volatility3
+ISF_EXTENSIONS = ('.json', '.json.gz', '.json.bz2', '.json.xz')
+
+def print_colored(text, color='white', style='normal'):
+    """Print colored text for better readability"""
+    colors = {
+        'red': '\033[91m',
+        'green': '\033[92m',
+        'yellow': '\033[93m',
+        'blue': '\033[94m',
+        'magenta': '\033[95m',
+        'cyan': '\033[96m',
+        'white': '\033[97m',
+        'reset': '\033[0m'
+    }
+    
+    styles = {
+        'bold': '\033[1m',
+        'underline': '\033[4m',
+        'normal': ''
+    }
+    
+    color_code = colors.get(color, colors['white'])
+    style_code = styles.get(style, styles['normal'])
+    reset_code = colors['reset']
+    
+    print(f"{style_code}{color_code}{text}{reset_code}")
+
+def get_venv_python(venv_dir):
+    """Get the Python executable from virtual environment"""
+    if platform.system() == 'Windows':
+        return venv_dir / "Scripts" / "python.exe"
+    else:
+        return venv_dir / "bin" / "python3"
+
+def is_isf_file(path):
+    """Check whether a file name looks like an ISF symbol file"""
+    return path.name.lower().endswith(ISF_EXTENSIONS)
+
+def isf_stem(path):
+    """Strip the ISF extension from a file name"""
+    name = path.name
+    for extension in sorted(ISF_EXTENSIONS, key=len, reverse=True):
+        if name.lower().endswith(extension):
+            return name[:-len(extension)]
+    return name
+
+def open_isf(path):
+    """Open an ISF file for reading, decompressing if needed"""
+    name = path.name.lower()
+    if name.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if name.endswith('.bz2'):
+        return bz2.open(path, 'rb')
+    if name.endswith('.xz'):
+        return lzma.open(path, 'rb')
+    return open(path, 'rb')
+
+def load_isf(path):
+    """Load and parse an ISF file"""
+    with open_isf(path) as f:
+        return json.load(f)
+
+def get_windows_key(metadata):
+    """Build the pdb-name/GUID-age key Volatility3 uses to find Windows symbols"""
+    pdb = metadata.get('windows', {}).get('pdb', {})
+    database, guid, age = pdb.get('database'), pdb.get('GUID'), pdb.get('age')
+    if not (database and guid and age is not None):
+        return None
+    return f"{database.strip(chr(0))}/{guid.upper()}-{age}"
+
+def get_symbol_target(isf_data, relative_source):
+    """Work out where an ISF file belongs in the Volatility3 symbols tree
+    
+    Linux/Mac files keep their mirror subdirectory, so kernels that share a
+    file name in different directories (ubuntu/, debian/, ...) do not collide.
+    """
+    metadata = isf_data.get('metadata', {})
+    if 'windows' in metadata:
+        key = get_windows_key(metadata)
+        if key:
+            return 'windows', key, Path('windows') / f"{key}.json.xz"
+        return None
+    for os_family in ('linux', 'mac'):
+        if os_family in metadata:
+            subdirectory = relative_source.parent
+            key = (subdirectory / isf_stem(relative_source)).as_posix()
+            return os_family, key, Path(os_family) / f"{key}.json.xz"
+    return None
+
+def write_compressed_isf(isf_data, target):
+    """Write ISF data as a compact xz-compressed file"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_target = target.with_name(target.name + '.tmp')
+    with lzma.open(temp_target, 'wb', preset=6) as f:
+        f.write(json.dumps(isf_data, separators=(',', ':')).encode('utf-8'))
+    os.replace(temp_target, target)
+
+def convert_pdb_files(mirror_dir, venv_dir, volatility_dir, output_dir, symbols_dir, index):
+    """Convert new or changed PDB files from the mirror to ISF using Volatility3's pdbconv"""
+    pdb_files = sorted(p for p in mirror_dir.rglob('*.pdb')
+                       if p.is_file() and not is_source_current(p, symbols_dir, index))
+    if not pdb_files:
+        return []
+    
+    venv_python = get_venv_python(venv_dir)
+    pdbconv = volatility_dir / "volatility3" / "framework" / "symbols" / "windows" / "pdbconv.py"
+    if not venv_python.exists() or not pdbconv.exists():
+        print_colored("Warning: Skipping PDB conversion, venv or pdbconv.py not found", 'yellow')
+        return []
+    
+    converted = []
+    env = dict(os.environ, PYTHONPATH=str(volatility_dir))
+    for pdb_file in pdb_files:
+        output_file = output_dir / f"{pdb_file.stem}-{len(converted)}.json"
+        result = subprocess.run(
+            [str(venv_python), str(pdbconv), '-f', str(pdb_file), '-o', str(output_file)],
+            capture_output=True, text=True, env=env
+        )
+        if result.returncode == 0 and output_file.exists():
+            converted.append((pdb_file, output_file))
+        else:
+            print_colored(f"Warning: Failed to convert {pdb_file.name}: {result.stderr.strip()}", 'yellow')
+    return converted
+
+def load_symbol_index(index_file):
+    """Load the existing symbol index, or start a new one"""
+    if index_file.exists():
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if isinstance(index, dict):
+                index.setdefault('sources', {})
+                index.setdefault('symbols', {})
+                index.setdefault('banner_sources', {})
+                return index
+        except (OSError, json.JSONDecodeError):
+            pass
+    return {'sources': {}, 'symbols': {}, 'banner_sources': {}}
+
+def source_fingerprint(path):
+    """Cheap change detector for a mirror file"""
+    stat_result = path.stat()
+    return f"{stat_result.st_size}:{stat_result.st_mtime_ns}"
+
+def is_source_current(source, symbols_dir, index):
+    """Check whether a mirror file was already ingested and has not changed since"""
+    known = index['sources'].get(str(source))
+    return bool(known and known.get('fingerprint') == source_fingerprint(source)
+                and (symbols_dir / known['target']).exists())
+
+def ingest_isf(source, isf_source, mirror_dir, symbols_dir, index):
+    """Copy one ISF file into the symbols tree and record it in the index"""
+    if is_source_current(source, symbols_dir, index):
+        return False
+    
+    fingerprint = source_fingerprint(source)
+    
+    try:
+        isf_data = load_isf(isf_source)
+    except (OSError, ValueError, EOFError, lzma.LZMAError) as e:
+        print_colored(f"Warning: Unreadable symbol file {source.name}: {e}", 'yellow')
+        return False
+    
+    target_info = get_symbol_target(isf_data, source.relative_to(mirror_dir))
+    if target_info is None:
+        print_colored(f"Warning: No OS metadata in {source.name}, skipping", 'yellow')
+        return False
+    
+    os_family, key, relative_target = target_info
+    target = relative_target.as_posix()
+    for other_source, other in index['sources'].items():
+        if other.get('target') == target and other_source != str(source) and Path(other_source).exists():
+            print_colored(f"Warning: {source} replaces the symbols from {other_source} ({target})", 'yellow')
+    write_compressed_isf(isf_data, symbols_dir / relative_target)
+    
+    index['symbols'].setdefault(os_family, {})[key] = target
+    index['sources'][str(source)] = {'fingerprint': fingerprint, 'target': target}
+    return True
+
+def get_fixture_symbol_keys(fixtures_dir):
+    """Windows symbol keys of the synthetic test images, from their manifests"""
+    keys = set()
+    if not fixtures_dir.exists():
+        return keys
+    for manifest_file in fixtures_dir.glob('*.json'):
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                pdb = json.load(f).get('pdb', {})
+        except (OSError, ValueError, AttributeError):
+            continue
+        if pdb.get('name') and pdb.get('guid') and pdb.get('age') is not None:
+            keys.add(f"{pdb['name']}/{pdb['guid'].upper()}-{pdb['age']}")
+    return keys
+
+def index_existing_windows_symbols(symbols_dir, index, skip_keys=()):
+    """Add Windows ISF files already in the symbols tree to the GUID/age index"""
+    windows_dir = symbols_dir / "windows"
+    windows_index = index['symbols'].setdefault('windows', {})
+    for key in skip_keys:
+        windows_index.pop(key, None)
+    if not windows_dir.exists():
+        return
+    
+    for isf_file in windows_dir.rglob('*'):
+        if not (isf_file.is_file() and is_isf_file(isf_file)):
+            continue
+        relative = isf_file.relative_to(symbols_dir)
+        # Volatility3 stores Windows symbols as windows/<pdb name>/<GUID>-<age>.json[.xz]
+        if len(relative.parts) == 3:
+            key = f"{relative.parts[1]}/{isf_stem(isf_file).upper()}"
+            if key not in skip_keys:
+                windows_index.setdefault(key, relative.as_posix())
+
+def extract_banner(isf_data):
+    """Get the kernel banner a Linux or Mac ISF file was built for"""
+    symbols = isf_data.get('symbols', {})
+    for symbol_name in ('linux_banner', 'version'):
+        constant_data = symbols.get(symbol_name, {}).get('constant_data')
+        if constant_data:
+            try:
+                return normalize_banner(base64.b64decode(constant_data))
+            except (binascii.Error, ValueError):
+                return None
+    return None
+
+def scan_banner_sources(symbol_dirs, index):
+    """Read banners from ISF files, reusing results for unchanged files"""
+    known = index.get('banner_sources', {})
+    sources = {}
+    for symbol_dir in symbol_dirs:
+        if not symbol_dir.exists():
+            continue
+        for isf_file in symbol_dir.rglob('*'):
+            if not (isf_file.is_file() and is_isf_file(isf_file)):
+                continue
+            fingerprint = source_fingerprint(isf_file)
+            previous = known.get(str(isf_file))
+            if previous and previous.get('fingerprint') == fingerprint:
+                sources[str(isf_file)] = previous
+                continue
+            
+            try:
+                banner = extract_banner(load_isf(isf_file))
+            except (OSError, ValueError, EOFError, lzma.LZMAError):
+                banner = None
+            sources[str(isf_file)] = {
+                'fingerprint': fingerprint,
+                'banner': base64.b64encode(banner).decode('ascii') if banner else None
+            }
+    index['banner_sources'] = sources
+    return sources
+
+def write_banner_index(sources, banner_index_file):
+    """Write the sorted, fixed-width banner index and its path table"""
+    entries = sorted(
+        (banner_key(base64.b64decode(info['banner'])), path.encode('utf-8'))
+        for path, info in sources.items() if info.get('banner')
+    )
+    
+    path_table = bytearray()
+    records = bytearray()
+    for key, path in entries:
+        records += BANNER_RECORD.pack(key, len(path_table), len(path))
+        path_table += path
+    
+    temp_file = banner_index_file.with_name(banner_index_file.name + '.tmp')
+    with open(temp_file, 'wb') as f:
+        f.write(BANNER_HEADER.pack(BANNER_MAGIC, BANNER_VERSION, len(entries),
+                                   BANNER_HEADER.size + len(records)))
+        f.write(records)
+        f.write(path_table)
+    os.replace(temp_file, banner_index_file)
+    return len(entries)
+
+def prepare_symbols():
+    """Prefetch symbols from a local mirror into the Volatility3 symbols tree"""
+    print_colored("=== Preparing Volatility3 Symbol Cache ===", 'cyan', 'bold')
+    print()
+    
+    PROJECT_DIR = Path.home() / "volatility-mcp-server"
+    VOLATILITY_DIR = PROJECT_DIR / "volatility3"
+    VENV_DIR = PROJECT_DIR / "venv"
+    SYMBOLS_DIR = VOLATILITY_DIR / "volatility3" / "symbols"
+    INDEX_FILE = PROJECT_DIR / "config" / "symbol_index.json"
+    BANNER_INDEX_FILE = PROJECT_DIR / "config" / "banner_index.bin"
+    BANNER_READER_FILE = PROJECT_DIR / "src" / "banner_index.py"
+    FIXTURES_DIR = PROJECT_DIR / "tests" / "fixtures"
+    EXTRA_SYMBOL_DIRS = [Path(path) for path in os.environ.get('VOLATILITY_MCP_SYMBOL_DIRS', '').split(os.pathsep) if path]
+    MIRROR_DIR = Path(os.environ.get('VOLATILITY_MCP_SYMBOL_MIRROR', PROJECT_DIR / "symbol_mirror"))
+    
+    print_colored(f"Symbols directory: {SYMBOLS_DIR}", 'white')
+    print_colored(f"Symbol mirror: {MIRROR_DIR}", 'white')
+    print()
+    
+    if not VOLATILITY_DIR.exists():
+        print_colored(f"ERROR: Volatility3 directory not found at {VOLATILITY_DIR}", 'red')
+        return 1
+    
+    SYMBOLS_DIR.mkdir(parents=True, exist_ok=True)
+    INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    index = load_symbol_index(INDEX_FILE)
+    
+    ingested = 0
+    if MIRROR_DIR.exists():
+        for source in sorted(MIRROR_DIR.rglob('*')):
+            if source.is_file() and is_isf_file(source):
+                if ingest_isf(source, source, MIRROR_DIR, SYMBOLS_DIR, index):
+                    ingested += 1
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for pdb_file, isf_file in convert_pdb_files(MIRROR_DIR, VENV_DIR, VOLATILITY_DIR, Path(temp_dir),
+                                                         SYMBOLS_DIR, index):
+                if ingest_isf(pdb_file, isf_file, MIRROR_DIR, SYMBOLS_DIR, index):
+                    ingested += 1
+    else:
+        print_colored("No symbol mirror found, indexing existing symbols only", 'yellow')
+    
+    # The benchmark fixture's synthetic kernel ISF shares the tree but is not a real symbol
+    index_existing_windows_symbols(SYMBOLS_DIR, index, get_fixture_symbol_keys(FIXTURES_DIR))
+    
+    # Map Linux/Mac kernel banners to their ISF files
+    banner_dirs = [SYMBOLS_DIR / "linux", SYMBOLS_DIR / "mac"] + EXTRA_SYMBOL_DIRS
+    banner_count = write_banner_index(scan_banner_sources(banner_dirs, index), BANNER_INDEX_FILE)
+    
+    # Ship the reader next to the server so it can look up banners without this script
+    BANNER_READER_FILE.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(Path(__file__).parent / "banner_index.py", BANNER_READER_FILE)
+    
+    with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+    
+    counts = {os_family: len(entries) for os_family, entries in index['symbols'].items()}
+    print_colored(f"Ingested {ingested} new symbol file(s) from the mirror", 'green')
+    for os_family, count in sorted(counts.items()):
+        print_colored(f"  {os_family}: {count} indexed", 'green')
+    print_colored(f"Symbol index written to: {INDEX_FILE}", 'green')
+    print_colored(f"Banner index written to: {BANNER_INDEX_FILE} ({banner_count} banners)", 'green')
+    print_colored(f"Banner index reader copied to: {BANNER_READER_FILE}", 'green')
+    return 0
+
+def main():
+    """Prepare the symbol cache, or look up a banner in the existing index"""
+    parser = argparse.ArgumentParser(description="Prepare the Volatility3 symbol cache")
+    parser.add_argument("--lookup-banner", metavar="BANNER", help="Print the ISF files for a kernel banner")
+    args = parser.parse_args()
+    
+    if args.lookup_banner:
+        banner_index_file = Path.home() / "volatility-mcp-server" / "config" / "banner_index.bin"
+        if not banner_index_file.exists():
+            print_colored(f"ERROR: Banner index not found: {banner_index_file}", 'red')
+            print_colored("Run 06_prepare_symbols.py first to build it", 'yellow')
+            return 1
+        try:
+            matches = lookup_banner(banner_index_file, args.lookup_banner)
+        except ValueError as e:
+            print_colored(f"ERROR: {e}", 'red')
+            print_colored("Run 06_prepare_symbols.py again to rebuild it", 'yellow')
+            return 1
+        for match in matches:
+            print(match)
+        return 0 if matches else 1
+    
+    return prepare_symbols()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Kernel banner index format and reader
+
+config/banner_index.bin maps Linux/Mac kernel banners to the ISF files built
+for them. It is written by 06_prepare_symbols.py, which also copies this
+module to src/ so the MCP server can import it.
+
+Layout (little-endian):
+- header:  magic b'VMBI', version (uint32), record count (uint32),
+           path table offset (uint64)
+- records: count x (16-byte key, path offset (uint32), path length (uint32)),
+           sorted by key; the key is the first 16 bytes of the SHA-256 of the
+           banner with trailing NUL/newline bytes stripped
+- path table: UTF-8 ISF paths; a record's path starts at
+              path table offset + path offset
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+
+BANNER_MAGIC = b'VMBI'
+BANNER_VERSION = 1
+BANNER_KEY_SIZE = 16
+BANNER_HEADER = struct.Struct('<4sIIQ')
+BANNER_RECORD = struct.Struct(f'<{BANNER_KEY_SIZE}sII')
+
+def normalize_banner(banner):
+    """Strip the NUL/newline padding that differs between ISF data and memory"""
+    return banner.rstrip(b'\x00\r\n')
+
+def banner_key(banner):
+    """Fixed-width sort key for a banner"""
+    return hashlib.sha256(normalize_banner(banner)).digest()[:BANNER_KEY_SIZE]
+
+def lookup_banner(banner_index_file, banner):
+    """Find the ISF files for a kernel banner with a binary search over the mmapped index"""
+    if isinstance(banner, str):
+        banner = banner.encode('utf-8')
+    key = banner_key(banner)
+    if os.path.getsize(banner_index_file) < BANNER_HEADER.size:
+        raise ValueError(f"Not a banner index: {banner_index_file}")
+    
+    with open(banner_index_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        magic, version, count, table_offset = BANNER_HEADER.unpack_from(data, 0)
+        if magic != BANNER_MAGIC or version != BANNER_VERSION:
+            raise ValueError(f"Not a banner index: {banner_index_file}")
+        
+        def record_key(position):
+            offset = BANNER_HEADER.size + position * BANNER_RECORD.size
+            return data[offset:offset + BANNER_KEY_SIZE]
+        
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if record_key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        
+        matches = []
+        while low < count and record_key(low) == key:
+            _, path_offset, path_length = BANNER_RECORD.unpack_from(data, BANNER_HEADER.size + low * BANNER_RECORD.size)
+            start = table_offset + path_offset
+            matches.append(data[start:start + path_length].decode('utf-8'))
+            low += 1
+    return matches
\ No newline at end of file
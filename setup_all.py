@@ -4,12 +4,69 @@ Master Cross-Platform Setup Script for Volatility3 MCP Server
 Compatible with Windows, Linux, and macOS
 """
 
+import argparse
+import hashlib
+import json
+import os
 import sys
 import subprocess
 import platform
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 
+PROJECT_DIR = Path.home() / "volatility-mcp-server"
+STATE_FILE = PROJECT_DIR / ".setup_state.json"
+MAX_PARALLEL_STEPS = 4
+OUTPUT_LOCK = threading.Lock()
+
+# Setup step graph. A step starts once all of its "deps" have finished, and
+# cached steps are skipped when their fingerprint (script, arguments, "inputs",
+# "env" and the files named by "env_files") matches the last successful run and
+# their "outputs" still exist.
+SETUP_STEPS = [
+    {"id": "prerequisites", "name": "Prerequisites Check", "script": "00_check_prerequisites.py",
+     "args": [], "deps": [], "cache": False, "inputs": [], "env": [], "outputs": []},
+    {"id": "structure", "name": "Project Structure", "script": "01_setup_volatility_mcp.py",
+     "args": ["--step", "structure"], "deps": ["prerequisites"], "cache": True, "inputs": [], "env": [],
+     "outputs": ["src", "config", "logs", "memory_images", "reports", "tests", "scripts"]},
+    {"id": "clone", "name": "Volatility3 Checkout", "script": "01_setup_volatility_mcp.py",
+     "args": ["--step", "clone"], "deps": ["prerequisites"], "cache": True, "inputs": [],
+     "env": ["VOLATILITY_MCP_VOL3_REF", "VOLATILITY_MCP_VOL3_BUNDLE", "VOLATILITY_MCP_VOL3_BUNDLE_SHA256"],
+     "env_files": ["VOLATILITY_MCP_VOL3_BUNDLE"], "outputs": ["volatility3"]},
+    {"id": "venv", "name": "Virtual Environment", "script": "01_setup_volatility_mcp.py",
+     "args": ["--step", "venv"], "deps": ["prerequisites"], "cache": True, "inputs": [], "env": [],
+     "outputs": ["venv"]},
+    {"id": "install", "name": "Dependencies", "script": "01_setup_volatility_mcp.py",
+     "args": ["--step", "install"], "deps": ["clone", "venv"], "cache": True,
+     "inputs": ["volatility3/requirements.txt"],
+     "env": ["VOLATILITY_MCP_INDEX_URL", "VOLATILITY_MCP_OFFLINE", "VOLATILITY_MCP_WHEELHOUSE"],
+     "outputs": ["venv"]},
+    # Not cached: .git/HEAD names the branch, not the commit, so it does not change on
+    # a pull; build_plugin_index compares the checkout's revision with the index itself
+    {"id": "index", "name": "Plugin Index", "script": "01_setup_volatility_mcp.py",
+     "args": ["--step", "index"], "deps": ["clone", "structure"], "cache": False,
+     "inputs": [], "env": [], "outputs": ["config/plugin_index.json"]},
+    {"id": "server", "name": "MCP Server Creation", "script": "02_create_mcp_server.py",
+     "args": [], "deps": ["prerequisites"], "cache": True, "inputs": [], "env": [],
+     "outputs": ["src/mcp_server.py"]},
+    {"id": "configs", "name": "Configuration Files", "script": "03_create_configs.py",
+     "args": [], "deps": ["prerequisites"], "cache": True, "inputs": [], "env": [],
+     "outputs": ["config/mcp_windows.json", "config/mcp_linux.json", "config/mcp_claude.json"]},
+    {"id": "tests", "name": "Test Scripts", "script": "04_create_test_script.py",
+     "args": [], "deps": ["prerequisites"], "cache": True, "inputs": [], "env": [],
+     "outputs": ["tests/test_server.py", "scripts/generate_synthetic_image.py"]},
+    {"id": "launcher", "name": "Launcher Scripts", "script": "05_create_launch_script.py",
+     "args": [], "deps": ["structure"], "cache": True, "inputs": [], "env": [],
+     "outputs": ["launcher.py"]},
+    # Not cached: the mirror and extra symbol directories can change anywhere below
+    # their roots, and 06 already skips sources that are unchanged since the last run
+    {"id": "symbols", "name": "Symbol Cache", "script": "06_prepare_symbols.py",
+     "args": [], "deps": ["install", "structure"], "cache": False, "inputs": [], "env": [],
+     "outputs": ["config/symbol_index.json", "config/banner_index.bin", "src/banner_index.py"]}
+]
+
 def print_colored(text, color='white', style='normal'):
     """Print colored text for better readability"""
     colors = {
@@ -35,24 +92,160 @@ def print_colored(text, color='white', style='normal'):
     
     print(f"{style_code}{color_code}{text}{reset_code}")
 
-def run_script(script_name, script_path):
-    """Run a Python script and handle errors"""
-    print_colored(f"Running {script_name}...", 'yellow', 'bold')
-    print_colored("-" * 50, 'yellow')
-    
+def print_status(text, color='white', style='normal'):
+    """Print a line without interleaving it with output from running steps"""
+    with OUTPUT_LOCK:
+        print_colored(text, color, style)
+        sys.stdout.flush()
+
+def print_step_line(step, text):
+    """Print a line of step output, prefixed with the step id"""
+    with OUTPUT_LOCK:
+        print(f"[{step['id']}] {text}", flush=True)
+
+def run_step(step, script_path):
+    """Run one setup step in its own interpreter, streaming its output as it arrives"""
+    env = dict(os.environ, PYTHONIOENCODING='utf-8', PYTHONUNBUFFERED='1')
     try:
-        result = subprocess.run([sys.executable, str(script_path)], 
-                              check=True, 
-                              capture_output=False)
-        print_colored(f"✓ {script_name} completed successfully", 'green', 'bold')
-        return True
-    except subprocess.CalledProcessError as e:
-        print_colored(f"✗ {script_name} failed with exit code {e.returncode}", 'red', 'bold')
-        return False
+        process = subprocess.Popen([sys.executable, str(script_path)] + step["args"],
+                                   stdin=subprocess.DEVNULL,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT,
+                                   env=env)
+        for line in process.stdout:
+            print_step_line(step, line.decode('utf-8', errors='replace').rstrip())
+        return process.wait() == 0
     except Exception as e:
-        print_colored(f"✗ {script_name} failed with error: {e}", 'red', 'bold')
+        print_status(f"[{step['id']}] ERROR: {e}", 'red')
         return False
 
+def load_setup_state():
+    """Load the fingerprints of previously completed steps"""
+    if STATE_FILE.exists():
+        try:
+            with open(STATE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass
+    return {}
+
+def save_setup_state(state):
+    """Record the fingerprints of completed steps"""
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+
+def step_fingerprint(step, script_path, dependency_fingerprints):
+    """Hash everything a step's result depends on"""
+    digest = hashlib.sha256()
+    digest.update(script_path.read_bytes())
+    digest.update(json.dumps([sys.executable] + step["args"]).encode())
+    
+    for relative_path in step["inputs"]:
+        input_path = PROJECT_DIR / relative_path
+        if input_path.is_file():
+            digest.update(input_path.read_bytes())
+        elif input_path.exists():
+            digest.update(str(input_path.stat().st_mtime_ns).encode())
+        else:
+            digest.update(b"missing")
+    
+    for name in step["env"]:
+        digest.update(f"{name}={os.environ.get(name, '')}".encode())
+    
+    # A file replaced at the same path (plus its .sha256 sidecar) must invalidate the step
+    for name in step.get("env_files", []):
+        value = os.environ.get(name, '').strip()
+        if not value:
+            continue
+        for file_path in (Path(value), Path(value + ".sha256")):
+            if file_path.is_file():
+                file_stat = file_path.stat()
+                digest.update(f"{file_path}:{file_stat.st_size}:{file_stat.st_mtime_ns}".encode())
+            else:
+                digest.update(b"missing")
+    
+    for fingerprint in dependency_fingerprints:
+        digest.update(fingerprint.encode())
+    return digest.hexdigest()
+
+def run_setup_graph(script_dir, force=False):
+    """Run setup steps as soon as their dependencies finish, skipping up-to-date ones"""
+    steps = {step["id"]: step for step in SETUP_STEPS}
+    state = {} if force else load_setup_state()
+    results = {}
+    fingerprints = {}
+    executed = set()
+    pending = list(SETUP_STEPS)
+    running = {}
+    
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_STEPS) as executor:
+        while pending or running:
+            # Start every step whose dependencies are done
+            progress = True
+            while progress:
+                progress = False
+                for step in list(pending):
+                    dependency_results = [results.get(dep) for dep in step["deps"]]
+                    if any(result in ('failed', 'blocked') for result in dependency_results):
+                        pending.remove(step)
+                        results[step["id"]] = 'blocked'
+                        print_status(f"✗ {step['name']} skipped (dependency failed)", 'red')
+                        progress = True
+                        continue
+                    if not all(result in ('completed', 'up-to-date') for result in dependency_results):
+                        continue
+                    
+                    pending.remove(step)
+                    progress = True
+                    script_path = script_dir / step["script"]
+                    if not script_path.exists():
+                        results[step["id"]] = 'failed'
+                        print_status(f"✗ Script not found: {step['script']}", 'red', 'bold')
+                        continue
+                    
+                    fingerprint = step_fingerprint(step, script_path, [fingerprints[dep] for dep in step["deps"]])
+                    fingerprints[step["id"]] = fingerprint
+                    
+                    # Re-run when an upstream cached step actually ran in this session
+                    upstream_changed = any(dep in executed and steps[dep]["cache"] for dep in step["deps"])
+                    outputs_exist = all((PROJECT_DIR / output).exists() for output in step["outputs"])
+                    if step["cache"] and not upstream_changed and outputs_exist and state.get(step["id"]) == fingerprint:
+                        results[step["id"]] = 'up-to-date'
+                        print_status(f"✓ {step['name']} is up to date, skipping", 'green')
+                        continue
+                    
+                    command = ' '.join([step["script"]] + step["args"])
+                    print_status(f"▶ Starting {step['name']} ({command})...", 'yellow', 'bold')
+                    running[executor.submit(run_step, step, script_path)] = step
+            
+            if not running:
+                break
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                success = future.result()
+                
+                if success:
+                    print_status(f"✓ {step['name']} completed successfully", 'green', 'bold')
+                else:
+                    print_status(f"✗ {step['name']} failed", 'red', 'bold')
+                
+                executed.add(step["id"])
+                if success:
+                    results[step["id"]] = 'completed'
+                    if step["cache"]:
+                        state[step["id"]] = fingerprints[step["id"]]
+                else:
+                    results[step["id"]] = 'failed'
+                    state.pop(step["id"], None)
+                save_setup_state(state)
+    
+    for step in pending:
+        results[step["id"]] = 'blocked'
+    return results
+
 def display_header():
     """Display setup header with system information"""
     print_colored("="*80, 'cyan')
@@ -83,13 +276,16 @@ def display_setup_steps():
         "3. Create MCP server placeholder",
         "4. Generate configuration files",
         "5. Create test scripts",
-        "6. Create launcher scripts"
+        "6. Create launcher scripts",
+        "7. Prepare the offline symbol cache"
     ]
     
     for step in steps:
         print_colored(f"  {step}", 'blue')
     
     print()
+    print_colored("Independent steps run in parallel, and steps that are already up to date are skipped.", 'white')
+    print_colored("Use --force to re-run everything.", 'white')
     print_colored("The complete setup typically takes 2-5 minutes depending on your system.", 'yellow')
     print()
 
@@ -106,6 +302,10 @@ def confirm_setup():
 
 def main():
     """Main setup function"""
+    parser = argparse.ArgumentParser(description="Set up the Volatility3 MCP server")
+    parser.add_argument("--force", action="store_true", help="Re-run every step, ignoring recorded fingerprints")
+    args = parser.parse_args()
+    
     display_header()
     display_setup_steps()
     
@@ -120,67 +320,14 @@ def main():
     # Get script directory
     script_dir = Path(__file__).parent
     
-    # Define setup scripts in order
-    setup_scripts = [
-        ("Prerequisites Check", "00_check_prerequisites.py"),
-        ("Project Setup", "01_setup_volatility_mcp.py"),
-        ("MCP Server Creation", "02_create_mcp_server.py"),
-        ("Configuration Files", "03_create_configs.py"),
-        ("Test Scripts", "04_create_test_script.py"),
-        ("Launcher Scripts", "05_create_launch_script.py")
-    ]
-    
     # Track progress
-    total_steps = len(setup_scripts)
-    completed_steps = 0
-    failed_steps = []
+    total_steps = len(SETUP_STEPS)
     start_time = time.time()
     
-    # Run each setup script
-    for i, (step_name, script_file) in enumerate(setup_scripts, 1):
-        script_path = script_dir / script_file
-        
-        if not script_path.exists():
-            print_colored(f"✗ Script not found: {script_file}", 'red', 'bold')
-            failed_steps.append(step_name)
-            continue
-        
-        print_colored(f"[{i}/{total_steps}] {step_name}", 'cyan', 'bold')
-        
-        # Special handling for prerequisites check
-        if script_file == "00_check_prerequisites.py":
-            try:
-                result = subprocess.run([sys.executable, str(script_path)], 
-                                      check=True, capture_output=False)
-                if result.returncode != 0:
-                    print_colored("Prerequisites check failed. Please install missing components.", 'red', 'bold')
-                    failed_steps.append(step_name)
-                    continue
-            except subprocess.CalledProcessError:
-                print_colored("Prerequisites check failed. Please install missing components.", 'red', 'bold')
-                failed_steps.append(step_name)
-                continue
-        
-        if run_script(step_name, script_path):
-            completed_steps += 1
-        else:
-            failed_steps.append(step_name)
-            
-            # For critical failures, ask if user wants to continue
-            if script_file in ["00_check_prerequisites.py", "01_setup_volatility_mcp.py"]:
-                print_colored(f"Critical step '{step_name}' failed.", 'red', 'bold')
-                print_colored("Do you want to continue anyway? [y/N]: ", 'yellow')
-                try:
-                    response = input().strip().lower()
-                    if response not in ['y', 'yes']:
-                        print_colored("Setup aborted.", 'red')
-                        return 1
-                except KeyboardInterrupt:
-                    print()
-                    print_colored("Setup aborted by user.", 'yellow')
-                    return 1
-        
-        print()
+    # Run the step graph, with independent steps in parallel
+    results = run_setup_graph(script_dir, force=args.force)
+    completed_steps = sum(1 for result in results.values() if result in ('completed', 'up-to-date'))
+    failed_steps = [step["name"] for step in SETUP_STEPS if results.get(step["id"]) in ('failed', 'blocked')]
     
     # Calculate elapsed time
     elapsed_time = time.time() - start_time
@@ -199,7 +346,7 @@ def main():
     print()
     
     # Project information
-    project_dir = Path.home() / "volatility-mcp-server"
+    project_dir = PROJECT_DIR
     
     if completed_steps == total_steps:
         print_colored("🎉 Setup completed successfully!", 'green', 'bold')
@@ -214,6 +361,7 @@ def main():
             "    📄 mcp_windows.json    # Windows VS Code configuration",
             "    📄 mcp_linux.json      # Linux/Mac VS Code configuration", 
             "    📄 mcp_claude.json     # Claude Desktop configuration",
+            "    📄 symbol_index.json   # Offline symbol cache index",
             "  📁 tests/",
             "    📄 test_server.py      # Comprehensive test suite",
             "  📁 logs/                 # Server logs",